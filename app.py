@@ -0,0 +1,27 @@
+"""All three Zappos dashboards in one multipage app.
+
+Run ``streamlit run app.py`` to serve them from a single process, so the
+dataset, figure and pre-baked caches are shared. A dashboard script runs
+only while its page is open, and imports only the module of the section
+selected in it. The scripts can still be run on their own.
+"""
+from pathlib import Path
+
+import streamlit as st
+
+from zappos_dash.navigation import script_run
+
+HERE = Path(__file__).resolve().parent
+
+pages = [
+    st.Page(HERE / "dashboard.py", title="Amazon-Zappos Acquisition",
+            icon="👟", url_path="acquisition", default=True),
+    st.Page(HERE / "final dashboard.py", title="Tony Hsieh Leadership",
+            icon="👔", url_path="leadership"),
+    st.Page(HERE / "new dashboard.py", title="Zappos Journey",
+            icon="📈", url_path="journey"),
+]
+
+# One scope for the whole run, navigation included; the pages share it
+with script_run():
+    st.navigation(pages).run()
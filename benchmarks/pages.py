@@ -0,0 +1,178 @@
+"""Headless per-page benchmark of the three dashboard scripts.
+
+Drives each script with Streamlit's AppTest harness, selects every entry
+of the sidebar page selectbox and records, per page:
+
+- cold wall time (first visit after clearing all caches) and warm wall
+  time (median of ``--repeat`` reruns of the same page),
+- peak Python heap allocated during a cold and a warm run (tracemalloc),
+- the number of emitted elements and their serialized protobuf size,
+  in total and per element type.
+
+Results are written as JSON so runs can be compared across commits:
+
+    python benchmarks/pages.py --output before.json
+    python benchmarks/pages.py --output after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ["dashboard.py", "final dashboard.py", "new dashboard.py"]
+
+
+def clear_caches():
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def select_page(at, page):
+    # The page selectbox is the first one in every script's sidebar
+    at.sidebar.selectbox[0].select(page)
+
+
+def timed_run(at, timeout):
+    start = time.perf_counter()
+    at.run(timeout=timeout)
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"Script raised: {at.exception[0].message}")
+    return elapsed
+
+
+def traced_run(at, timeout):
+    """Peak bytes allocated above the pre-run heap during one rerun."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        timed_run(at, timeout)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
+def iter_elements(block):
+    for child in block.children.values():
+        if hasattr(child, "children"):
+            yield from iter_elements(child)
+        else:
+            yield child
+
+
+def element_stats(at):
+    counts, sizes = Counter(), Counter()
+    for root in (at.main, at.sidebar):
+        for element in iter_elements(root):
+            counts[element.type] += 1
+            sizes[element.type] += element.proto.ByteSize()
+    return {
+        "elements": sum(counts.values()),
+        "element_bytes": sum(sizes.values()),
+        "by_type": {kind: {"count": counts[kind], "bytes": sizes[kind]}
+                    for kind in sorted(sizes, key=sizes.get, reverse=True)},
+    }
+
+
+def bench_script(script, repeat, timeout):
+    at = AppTest.from_file(str(ROOT / script), default_timeout=timeout)
+    clear_caches()
+    timed_run(at, timeout)
+    pages = list(at.sidebar.selectbox[0].options)
+    results = {page: {"script": script, "page": page} for page in pages}
+
+    # Cold visits, first for time and again for memory so that tracing
+    # does not distort the timings.
+    for page in pages:
+        clear_caches()
+        select_page(at, page)
+        results[page]["cold_s"] = timed_run(at, timeout)
+    for page in pages:
+        clear_caches()
+        select_page(at, page)
+        results[page]["cold_peak_bytes"] = traced_run(at, timeout)
+
+    # Warm reruns of each page with every cache populated
+    for page in pages:
+        select_page(at, page)
+        timed_run(at, timeout)
+        times = [timed_run(at, timeout) for _ in range(repeat)]
+        results[page]["warm_median_s"] = statistics.median(times)
+        results[page]["warm_min_s"] = min(times)
+        results[page]["warm_peak_bytes"] = traced_run(at, timeout)
+        results[page].update(element_stats(at))
+    return list(results.values())
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(rows, baseline=None):
+    previous = {(r["script"], r["page"]): r for r in (baseline or [])}
+    print(f"{'script / page':<50} {'cold ms':>8} {'warm ms':>8} {'peak KB':>8} "
+          f"{'elements':>8} {'KB sent':>8}")
+    for row in rows:
+        line = (f"{row['script'] + ' / ' + row['page']:<50} {row['cold_s'] * 1000:>8.1f} "
+                f"{row['warm_median_s'] * 1000:>8.1f} {row['cold_peak_bytes'] / 1024:>8.0f} "
+                f"{row['elements']:>8} {row['element_bytes'] / 1024:>8.1f}")
+        old = previous.get((row["script"], row["page"]))
+        if old:
+            change = row["warm_median_s"] / old["warm_median_s"] - 1
+            line += f"  warm {change:+.0%}"
+        print(line)
+
+
+def main():
+    # Cold runs must build everything themselves, not find it pre-warmed
+    os.environ.setdefault("ZAPPOS_WARMUP", "0")
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scripts", nargs="*", default=SCRIPTS,
+                        help="dashboard scripts to benchmark (default: all three)")
+    parser.add_argument("--repeat", type=int, default=5, help="warm reruns per page")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds per script run")
+    parser.add_argument("--output", default="bench_results.json", help="JSON results file")
+    parser.add_argument("--compare", help="previous results file to compare warm times against")
+    args = parser.parse_args()
+
+    rows = []
+    for script in args.scripts:
+        rows.extend(bench_script(script, args.repeat, args.timeout))
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": st.__version__,
+        "repeat": args.repeat,
+        "results": rows,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["results"]
+    print_table(rows, baseline)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compare the Plotly and Vega-Lite renderers on large inputs.
+
+Builds the cultural metrics chart and the annual revenue chart from
+synthetic frames with increasing row counts, once through the Plotly
+path and once through the Vega-Lite path (``ZAPPOS_RENDERER=vega``),
+and reports the median aggregate + build + serialize time and the size
+of the spec shipped to the browser. Both paths start from the same raw
+rows and run the same pandas aggregation the pages use, so the numbers
+compare the renderers alone.
+
+    python benchmarks/vega_vs_plotly.py [--sizes 1000 10000 ...] [--repeat 3]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from zappos_dash.acquisition.social_cultural_impact import (  # noqa: E402
+    CULTURAL_PHASES, cultural_chart, cultural_figure, cultural_means)
+from zappos_dash.journey.financial_performance import (  # noqa: E402
+    annual_revenue, revenue_chart, revenue_figure)
+
+SIZES = [1_000, 10_000, 100_000, 500_000]
+ASPECTS = ['Employee Satisfaction', 'Cultural Identity', 'Leadership Trust',
+           'Community Engagement', 'Brand Autonomy', 'Innovation Freedom']
+
+
+def synthetic_cultural(n, seed=0):
+    """``n`` survey responses: one aspect and a score per phase each."""
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({'Aspect': rng.choice(ASPECTS, n)})
+    for phase in CULTURAL_PHASES:
+        frame[phase] = rng.uniform(60, 100, n).round(1)
+    return frame
+
+
+def synthetic_revenue(n, seed=0):
+    """``n`` revenue bookings spread over 1999-2020."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Year': np.sort(rng.integers(1999, 2021, n)),
+        'Revenue_Million': rng.gamma(2.0, 2000 / n, n),
+    })
+
+
+# Chart -> (raw rows, aggregation shared by both renderers, builders)
+CHARTS = {
+    'cultural metrics': (synthetic_cultural, cultural_means,
+                         {'plotly': cultural_figure, 'vega': cultural_chart}),
+    'annual revenue': (synthetic_revenue, annual_revenue,
+                       {'plotly': revenue_figure, 'vega': revenue_chart}),
+}
+
+
+def build_and_serialize(prepare, build, frame, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        spec = build(prepare(frame)).to_json()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), len(spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                        help='input rows to test')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement')
+    args = parser.parse_args()
+
+    print(f"{'chart':>16} {'rows':>8} {'renderer':>8} {'agg+build+json ms':>18} {'spec KB':>10}")
+    for chart, (synthetic, prepare, builders) in CHARTS.items():
+        for size in args.sizes:
+            frame = synthetic(size)
+            for renderer, build in builders.items():
+                seconds, nbytes = build_and_serialize(prepare, build, frame, args.repeat)
+                print(f"{chart:>16} {size:>8} {renderer:>8} {seconds * 1000:>18.1f} "
+                      f"{nbytes / 1024:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
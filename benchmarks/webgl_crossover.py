@@ -0,0 +1,127 @@
+"""Find the point count where WebGL traces start to render faster than SVG.
+
+Builds the Performance Metrics chart at increasing point counts, once
+with SVG ``Scatter`` traces and once with ``Scattergl``, and reports the
+server-side build + serialize time and payload size of each. It also
+writes a self-contained HTML page that renders every variant in the
+browser, times ``Plotly.newPlot`` up to the next painted frame and
+reports the crossover; use it to tune ``ZAPPOS_WEBGL_THRESHOLD``.
+
+    python benchmarks/webgl_crossover.py [--output webgl_crossover.html] [--open]
+"""
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+import webbrowser
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from plotly.offline import get_plotlyjs
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from zappos_dash.acquisition.performance_metrics import performance_figure  # noqa: E402
+
+SIZES = [100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000]
+RENDERERS = {'svg': math.inf, 'webgl': 0}
+
+
+def synthetic_performance(n, seed=0):
+    """Performance frame with ``n`` daily rows shaped like the real data."""
+    rng = np.random.default_rng(seed)
+    walk = np.cumsum(rng.normal(0, 1, (n, 3)), axis=0)
+    return pd.DataFrame({
+        'Year': pd.date_range('2009-01-01', periods=n, freq='D'),
+        'Revenue_Estimate': 1000 + 5 * walk[:, 0],
+        'Employee_Count': 1600 + 2 * walk[:, 1],
+        'Customer_Satisfaction': 94 + 0.05 * walk[:, 2],
+    })
+
+
+def server_side(frame, threshold, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        spec = performance_figure(frame, webgl_threshold=threshold).to_json()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), spec
+
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>WebGL crossover</title>
+<script>{plotlyjs}</script></head>
+<body style="font-family: sans-serif">
+<h2>Performance Metrics chart: SVG vs WebGL render time</h2>
+<p id="status">Rendering...</p>
+<table border="1" cellpadding="4" id="results"><tr><th>Points per trace</th>
+<th>SVG (ms)</th><th>WebGL (ms)</th></tr></table>
+<div id="plot" style="width: 1200px; height: 600px"></div>
+<script>
+const SPECS = {specs};
+const REPEAT = 3;
+const frame = () => new Promise(resolve => requestAnimationFrame(() => resolve()));
+
+async function renderTime(spec) {{
+  const times = [];
+  for (let i = 0; i < REPEAT; i++) {{
+    Plotly.purge('plot');
+    await frame();
+    const start = performance.now();
+    await Plotly.newPlot('plot', spec.data, spec.layout);
+    await frame();
+    times.push(performance.now() - start);
+  }}
+  times.sort((a, b) => a - b);
+  return times[Math.floor(times.length / 2)];
+}}
+
+(async () => {{
+  let crossover = null;
+  for (const [size, variants] of Object.entries(SPECS)) {{
+    const svg = await renderTime(variants.svg);
+    const webgl = await renderTime(variants.webgl);
+    if (crossover === null && webgl < svg) crossover = size;
+    document.getElementById('results').insertAdjacentHTML('beforeend',
+      `<tr><td>${{size}}</td><td>${{svg.toFixed(1)}}</td><td>${{webgl.toFixed(1)}}</td></tr>`);
+  }}
+  document.getElementById('status').textContent = crossover === null
+    ? 'SVG was faster at every size tested.'
+    : `WebGL is faster from ${{crossover}} points per trace.`;
+}})();
+</script></body></html>
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', default='webgl_crossover.html',
+                        help='HTML page with the in-browser render benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                        help='points per trace to test')
+    parser.add_argument('--open', action='store_true', help='open the page in a browser')
+    args = parser.parse_args()
+
+    specs = {}
+    print(f"{'points':>8} {'renderer':>8} {'build+json ms':>14} {'payload KB':>11}")
+    for size in args.sizes:
+        frame = synthetic_performance(size)
+        specs[size] = {}
+        for renderer, threshold in RENDERERS.items():
+            seconds, spec = server_side(frame, threshold)
+            specs[size][renderer] = json.loads(spec)
+            print(f"{size:>8} {renderer:>8} {seconds * 1000:>14.1f} {len(spec) / 1024:>11.1f}")
+
+    output = Path(args.output)
+    output.write_text(PAGE.format(plotlyjs=get_plotlyjs(), specs=json.dumps(specs)),
+                      encoding='utf-8')
+    print(f"\nBrowser benchmark written to {output}")
+    if args.open:
+        webbrowser.open(output.resolve().as_uri())
+
+
+if __name__ == '__main__':
+    main()
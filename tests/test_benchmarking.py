@@ -0,0 +1,36 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from zappos_dash.benchmarking import min_max_scale, normalize
+
+
+def test_min_max_scale_spans_worst_to_best():
+    np.testing.assert_allclose(min_max_scale(np.array([[10.0, 20.0, 15.0]])), [[0, 100, 50]])
+
+
+def test_min_max_scale_handles_negative_rows():
+    np.testing.assert_allclose(min_max_scale(np.array([[-5.0, -1.0]])), [[0, 100]])
+
+
+@pytest.mark.parametrize('row', [[0.0, 0.0], [7.0, 7.0]])
+def test_min_max_scale_zero_range_scores_best(row):
+    np.testing.assert_allclose(min_max_scale(np.array([row])), [[100, 100]])
+
+
+def test_min_max_scale_all_nan_row_stays_nan_without_warnings():
+    values = np.array([[np.nan, np.nan], [1.0, np.nan]])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        scores = min_max_scale(values)
+    assert np.isnan(scores[0]).all()
+    np.testing.assert_allclose(scores[1], [100, np.nan])
+
+
+@pytest.mark.parametrize('method', ['range', 'percentile'])
+def test_lower_is_better_metrics_score_lowest_value_best(method):
+    values = np.array([[1.0, 2.0, 3.0], [1.0, 2.0, 3.0]])
+    scores = normalize(values, method, higher_is_better=[True, False])
+    np.testing.assert_allclose(scores[0], [0, 50, 100])
+    np.testing.assert_allclose(scores[1], [100, 50, 0])
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from zappos_dash.charts import journey_figure, to_long
+
+
+def series(fig):
+    return {trace.name: list(trace.y) for trace in fig.data}
+
+
+def test_journey_figure_scatters_rows_in_any_order():
+    long = pd.DataFrame({
+        'Factor': ['B', 'A', 'A', 'B'],
+        'Phase': ['Late', 'Early', 'Late', 'Early'],
+        'Score': [4, 1, 2, 3],
+    })
+    # Phases keep first-seen order: Late, Early
+    assert series(journey_figure(long)) == {'B': [4, 3], 'A': [2, 1]}
+
+
+def test_journey_figure_skips_rows_without_factor():
+    long = pd.DataFrame({
+        'Factor': ['A', 'B', None],
+        'Phase': ['Early', 'Early', 'Early'],
+        'Score': [1, 2, 99],
+    })
+    assert series(journey_figure(long)) == {'A': [1], 'B': [2]}
+
+
+def test_journey_figure_skips_rows_without_phase():
+    wide = pd.DataFrame({'Factor': ['A', 'B'], 'before': [1, 2], 'after': [3, 4]})
+    long = to_long(wide, 'Factor', ['before', 'after'], ['Before', 'After'])
+    long.loc[len(long)] = ['B', np.nan, 99]
+    assert series(journey_figure(long)) == {'A': [1, 3], 'B': [2, 4]}
@@ -0,0 +1,12 @@
+"""Pages of the Amazon-Zappos acquisition dashboard (``dashboard.py``)."""
+
+# Sidebar label -> page module; modules are imported only when selected
+PAGES = {
+    "📈 Executive Summary": "zappos_dash.acquisition.executive_summary",
+    "💰 Financial Analysis": "zappos_dash.acquisition.financial_analysis",
+    "🎯 Strategic Factors": "zappos_dash.acquisition.strategic_factors",
+    "👥 Social & Cultural Impact": "zappos_dash.acquisition.social_cultural_impact",
+    "🧠 Psychological Factors": "zappos_dash.acquisition.psychological_factors",
+    "📊 Performance Metrics": "zappos_dash.acquisition.performance_metrics",
+    "🔍 Key Insights & Interpretation": "zappos_dash.acquisition.key_insights",
+}
@@ -0,0 +1,139 @@
+"""Executive Summary page of the acquisition dashboard."""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from zappos_dash.charts import scatter
+from zappos_dash.data import has_dataset, load_acquisition_data, load_dataset
+from zappos_dash.downsample import MAX_POINTS, METHODS, downsample
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import plotly_chart
+
+DAILY_DATASET = 'acquisition/deal_value_daily'
+
+
+def build_timeline():
+    _, df_timeline, _, _ = load_acquisition_data()
+    fig_timeline = px.line(df_timeline, x='Date', y='Value (Millions)',
+                          title='Zappos Valuation Journey', markers=True,
+                          hover_data=['Event'])
+    fig_timeline.update_layout(height=400, showlegend=False)
+    fig_timeline.update_traces(line=dict(color='#FF9900', width=4), marker=dict(size=10))
+    return fig_timeline
+
+
+def build_daily_timeline(start=None, end=None, method='lttb'):
+    """Daily deal value per series, downsampled to the visible date range."""
+    _, df_timeline, _, _ = load_acquisition_data()
+    daily = load_dataset(DAILY_DATASET)
+
+    fig_timeline = go.Figure()
+    for series, rows in daily.groupby('Series', sort=False):
+        if not rows['Date'].is_monotonic_increasing:
+            rows = rows.sort_values('Date')
+        x, y = downsample(rows['Date'], rows['Value (Millions)'],
+                          MAX_POINTS, method, start, end)
+        fig_timeline.add_trace(scatter(x, y, mode='lines', name=series))
+
+    # Milestones stay on top as markers
+    events = df_timeline
+    if start is not None:
+        events = events[events['Date'] >= start]
+    if end is not None:
+        events = events[events['Date'] <= end]
+    fig_timeline.add_trace(go.Scatter(
+        x=events['Date'], y=events['Value (Millions)'], text=events['Event'],
+        mode='markers', name='Milestones', marker=dict(size=10, color='#FF9900'),
+        hovertemplate='%{text}<br>%{x|%Y-%m-%d}: $%{y:,.0f}M<extra></extra>'))
+    fig_timeline.update_layout(title='Zappos Valuation Journey', height=400,
+                               xaxis_title='Date', yaxis_title='Value (Millions)')
+    return fig_timeline
+
+
+def render_daily_timeline():
+    daily = load_dataset(DAILY_DATASET)
+    first, last = daily['Date'].min().date(), daily['Date'].max().date()
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        start, end = st.slider("Visible range", min_value=first, max_value=last,
+                               value=(first, last), format="YYYY-MM-DD")
+    with col2:
+        method = st.selectbox("Downsampling", list(METHODS), format_func=METHODS.get)
+
+    # Re-aggregate to the chosen range so each series sends at most
+    # MAX_POINTS points, however much history is loaded.
+    fig_timeline = cached_figure(__name__, build_daily_timeline,
+                                 start=str(start), end=str(end), method=method)
+    plotly_chart(fig_timeline, width="stretch")
+
+
+def render():
+    st.markdown('<div class="section-header">Executive Summary</div>', unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>🎯 Deal Value</h3>
+            <h2>$1.2B</h2>
+            <p>Final acquisition price</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>📅 Timeline</h3>
+            <h2>103 Days</h2>
+            <p>From agreement to close</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>📈 Growth</h3>
+            <h2>148%</h2>
+            <p>Revenue growth by 2015</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>🏆 Success Rate</h3>
+            <h2>90%</h2>
+            <p>Strategic objectives met</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Timeline visualization
+    st.subheader("📅 Acquisition Timeline")
+    if has_dataset(DAILY_DATASET):
+        render_daily_timeline()
+    else:
+        fig_timeline = cached_figure(__name__, build_timeline)
+        plotly_chart(fig_timeline, width="stretch")
+
+    # Key highlights
+    st.markdown("""
+    <div class="insight-box">
+        <h4>🔑 Key Acquisition Highlights</h4>
+        <ul>
+            <li><strong>Strategic Fit:</strong> Zappos' customer service excellence aligned perfectly with Amazon's customer-centric philosophy</li>
+            <li><strong>Cultural Preservation:</strong> Amazon agreed to maintain Zappos' unique company culture and operational independence</li>
+            <li><strong>Leadership Continuity:</strong> Tony Hsieh remained as CEO, ensuring smooth transition and cultural preservation</li>
+            <li><strong>Financial Success:</strong> Stock-based payment proved highly beneficial as Amazon's stock price grew significantly</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # References
+    st.markdown("**References:**")
+    st.markdown("""
+    - Amazon. (2009). Amazon.com to Acquire Zappos.com. Press Release.
+    - Zappos. (2009). Letter from Tony Hsieh to Employees. Inc. Magazine.
+    - SEC Filings. (2009). Amazon-Zappos Acquisition Details.
+    """)
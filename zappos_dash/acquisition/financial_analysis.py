@@ -0,0 +1,67 @@
+"""Financial Analysis page of the acquisition dashboard."""
+import streamlit as st
+import plotly.express as px
+
+from zappos_dash.data import load_acquisition_data, load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import plotly_chart
+
+
+def build_pie():
+    df_financial, _, _, _ = load_acquisition_data()
+    fig_pie = px.pie(df_financial, values='Amount (Millions)', names='Component',
+                    title='Deal Structure Breakdown ($934M Total)',
+                    color_discrete_sequence=['#FF9900', '#FFA500', '#FFB84D', '#FFCC80'])
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+    return fig_pie
+
+
+def build_valuation():
+    _, _, df_valuation, _ = load_acquisition_data()
+    fig_val = px.bar(df_valuation, x='Metric', y='Implied Value (Millions)',
+                    title='Morgan Stanley Valuation Analysis',
+                    color='Multiple', color_continuous_scale='viridis')
+    fig_val.update_layout(xaxis_tickangle=-45)
+    return fig_val
+
+
+def render():
+    st.markdown('<div class="section-header">Financial Analysis</div>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Deal structure pie chart
+        fig_pie = cached_figure(__name__, build_pie)
+        plotly_chart(fig_pie)
+
+    with col2:
+        # Valuation metrics
+        fig_val = cached_figure(__name__, build_valuation)
+        plotly_chart(fig_val)
+
+    # Financial metrics table
+    st.subheader("💹 Detailed Financial Breakdown")
+
+    financial_details = load_dataset('acquisition/financial_details')
+
+    st.dataframe(financial_details, width="stretch")
+
+    # ROI Analysis
+    st.subheader("📊 Return on Investment Analysis")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Amazon Stock Price (2009)", "$80.70", "Acquisition basis")
+    with col2:
+        st.metric("Amazon Stock Price (2015)", "$675.00", "+736% growth")
+    with col3:
+        st.metric("Zappos Revenue (2015)", ">$2B", "148% from acquisition")
+
+    # References
+    st.markdown("**References:**")
+    st.markdown("""
+    - Morgan Stanley. (2009). Amazon-Zappos Valuation Report.
+    - SEC Filings. (2009). Amazon-Zappos Financial Structure.
+    - Bloomberg. (2015). Amazon Stock Price Data.
+    """)
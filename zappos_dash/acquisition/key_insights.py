@@ -0,0 +1,186 @@
+"""Key Insights & Interpretation page of the acquisition dashboard."""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.navigation import fragment
+from zappos_dash.profiling import plotly_chart
+from zappos_dash.simulation import BANDS, BIN_EDGES, SCENARIOS, recommend, simulate
+
+# Calculator sliders: (label, default rating)
+FACTORS = [
+    ('Cultural Fit', 8),
+    ('Leadership Retention', 9),
+    ('Strategic Alignment', 9),
+    ('Financial Structure', 8),
+    ('Operational Synergies', 7),
+    ('Stakeholder Buy-in', 8),
+]
+
+
+def build_success(factor_importance=0.5):
+    success_analysis = load_dataset('acquisition/success_analysis')
+
+    success_analysis['Weighted Score'] = (success_analysis['Impact Score'] * factor_importance +
+                                        success_analysis['Sustainability Score'] * (1 - factor_importance))
+
+    fig_success = px.scatter(success_analysis, x='Impact Score', y='Sustainability Score',
+                           size='Weighted Score', color='Factor',
+                           title=f'Success Factor Analysis (Weight: {factor_importance:.1f} Impact, {1-factor_importance:.1f} Sustainability)')
+    fig_success.add_shape(type="line", x0=80, y0=70, x1=95, y1=95,
+                         line=dict(dash="dash", color="gray"))
+    return fig_success
+
+
+def build_simulation(ratings=tuple(rating for _, rating in FACTORS), spread=1.0):
+    result = simulate(ratings, spread)
+    centers = (BIN_EDGES[:-1] + BIN_EDGES[1:]) / 2
+
+    fig_simulation = go.Figure(go.Bar(
+        x=centers, y=result['counts'] / SCENARIOS * 100,
+        marker_color=[recommend(center)[1] for center in centers],
+        hovertemplate='Score %{x:.2f}: %{y:.2f}% of scenarios<extra></extra>'))
+    score = sum(ratings) / len(ratings)
+    fig_simulation.add_vline(x=score, line_dash='dash', line_color='gray',
+                             annotation_text=f'Slider score {score:.1f}')
+    fig_simulation.update_layout(title=f'Simulated M&A Success Scores ({SCENARIOS:,} scenarios)',
+                                 xaxis_title='Success score', yaxis_title='% of scenarios',
+                                 bargap=0, height=350)
+    return fig_simulation
+
+
+@fragment
+def render_success_factors():
+    """Weighting slider and success scatter; reruns on its own."""
+    # Interactive success factor analysis
+    factor_importance = st.slider("Adjust importance weighting:", 0.0, 1.0, 0.5, 0.1)
+
+    fig_success = cached_figure(__name__, build_success, factor_importance=factor_importance)
+    plotly_chart(fig_success, width="stretch")
+
+
+@fragment
+def render_score_calculator():
+    """M&A calculator sliders and score; reruns on its own."""
+    st.write("Rate the following factors for any M&A deal (1-10 scale):")
+
+    columns = st.columns(2)
+    ratings = []
+    for i, (label, default) in enumerate(FACTORS):
+        with columns[i // 3]:
+            ratings.append(st.slider(label, 1, 10, default))
+    ratings = tuple(ratings)
+
+    total_score = sum(ratings) / len(ratings)
+    recommendation, score_color = recommend(total_score)
+
+    st.markdown(f"""
+    <div style="background: {score_color}; color: white; padding: 1rem; border-radius: 10px; text-align: center;">
+        <h3>M&A Success Score: {total_score:.1f}/10</h3>
+        <h4>{recommendation}</h4>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if st.toggle("Simulation mode", help="Treat each rating as uncertain and simulate "
+                 f"{SCENARIOS:,} scenarios"):
+        render_simulation(ratings)
+
+
+def render_simulation(ratings):
+    spread = st.slider("Rating uncertainty (standard deviation, rating points)",
+                       0.5, 3.0, 1.0, 0.5)
+    # Cached per slider configuration: a repeated view neither draws nor builds again
+    result = simulate(ratings, spread)
+
+    columns = st.columns(len(BANDS))
+    for column, (_, recommendation, _) in zip(columns, BANDS):
+        column.metric(recommendation, f"{result['probabilities'][recommendation]:.1%}")
+    st.caption(f"Mean score {result['mean']:.2f}; 90% of scenarios between "
+               f"{result['p5']:.2f} and {result['p95']:.2f}")
+
+    fig_simulation = cached_figure(__name__, build_simulation, ratings=ratings, spread=spread)
+    plotly_chart(fig_simulation, width="stretch")
+
+
+def render():
+    st.markdown('<div class="section-header">Key Insights & Interpretation</div>', unsafe_allow_html=True)
+
+    # Executive insights
+    st.subheader("🔍 Strategic Insights")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="insight-box">
+            <h4>✅ What Worked Well</h4>
+            <ul>
+                <li><strong>Cultural Respect:</strong> Amazon's commitment to preserving Zappos' culture was crucial</li>
+                <li><strong>Operational Independence:</strong> Allowing Zappos to maintain its unique operating model</li>
+                <li><strong>Leadership Continuity:</strong> Tony Hsieh's continued leadership ensured smooth integration</li>
+                <li><strong>Financial Structure:</strong> Stock-based payment aligned long-term interests</li>
+                <li><strong>Strategic Synergies:</strong> Complementary strengths in service and scale</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="insight-box">
+            <h4>⚠️ Challenges & Lessons</h4>
+            <ul>
+                <li><strong>Cultural Drift:</strong> Gradual erosion of original culture over time</li>
+                <li><strong>Integration Pressure:</strong> Balancing independence with Amazon's systems</li>
+                <li><strong>Scale Challenges:</strong> Maintaining intimacy while growing rapidly</li>
+                <li><strong>Recent Struggles:</strong> 2023 workforce reduction indicates ongoing challenges</li>
+                <li><strong>Innovation Balance:</strong> Maintaining startup agility within corporate structure</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Success factors analysis
+    st.subheader("📈 Critical Success Factors")
+
+    render_success_factors()
+
+    # Final recommendations
+    st.subheader("🎯 Key Takeaways for M&A Strategy")
+
+    st.markdown("""
+    <div class="insight-box">
+        <h4>📋 M&A Best Practices from Amazon-Zappos</h4>
+
+        <h5>🏆 Strategic Recommendations:</h5>
+        <ol>
+            <li><strong>Culture First:</strong> Prioritize cultural fit and preservation in acquisition strategy</li>
+            <li><strong>Leadership Retention:</strong> Ensure key leadership stays to maintain continuity</li>
+            <li><strong>Operational Independence:</strong> Allow acquired companies to maintain successful operating models</li>
+            <li><strong>Long-term Alignment:</strong> Use equity-based compensation to align long-term interests</li>
+            <li><strong>Transparent Communication:</strong> Maintain open dialogue with all stakeholders throughout integration</li>
+        </ol>
+
+        <h5>⚡ Critical Warning Signs:</h5>
+        <ul>
+            <li>Forcing immediate cultural integration</li>
+            <li>Replacing successful leadership teams</li>
+            <li>Eliminating unique value propositions</li>
+            <li>Ignoring employee and customer concerns</li>
+            <li>Over-optimizing for short-term synergies</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Performance score calculator
+    st.subheader("🧮 M&A Success Score Calculator")
+
+    render_score_calculator()
+
+    # References
+    st.markdown("**References:**")
+    st.markdown("""
+    - Harvard Business Review. (2011). M&A Best Practices.
+    - Zappos Insights. (2023). Acquisition Lessons Learned.
+    - McKinsey & Company. (2010). M&A Success Factors Analysis.
+    """)
@@ -0,0 +1,88 @@
+"""Performance Metrics page of the acquisition dashboard."""
+import streamlit as st
+from plotly.subplots import make_subplots
+
+from zappos_dash.charts import scatter
+from zappos_dash.data import load_dataset
+from zappos_dash.progressive import ChartSlots
+
+
+def build_performance():
+    # Performance timeline
+    performance_data = load_dataset('acquisition/performance')
+    return performance_figure(performance_data)
+
+
+def performance_figure(performance_data, webgl_threshold=None):
+    """Four-panel performance chart; dense series switch to WebGL traces."""
+    # Multi-metric performance chart
+    fig_perf = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Revenue Growth', 'Employee Growth', 'Customer Satisfaction', 'Combined Performance'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}],
+               [{"secondary_y": False}, {"secondary_y": True}]]
+    )
+
+    # Revenue
+    fig_perf.add_trace(scatter(performance_data['Year'], performance_data['Revenue_Estimate'],
+                                webgl_threshold=webgl_threshold,
+                                mode='lines+markers', name='Revenue ($M)', line=dict(color='green')),
+                     row=1, col=1)
+
+    # Employees
+    fig_perf.add_trace(scatter(performance_data['Year'], performance_data['Employee_Count'],
+                                webgl_threshold=webgl_threshold,
+                                mode='lines+markers', name='Employees', line=dict(color='blue')),
+                     row=1, col=2)
+
+    # Customer satisfaction
+    fig_perf.add_trace(scatter(performance_data['Year'], performance_data['Customer_Satisfaction'],
+                                webgl_threshold=webgl_threshold,
+                                mode='lines+markers', name='Customer Satisfaction', line=dict(color='orange')),
+                     row=2, col=1)
+
+    # Combined
+    fig_perf.add_trace(scatter(performance_data['Year'], performance_data['Revenue_Estimate'],
+                                webgl_threshold=webgl_threshold,
+                                mode='lines', name='Revenue', line=dict(color='green')),
+                     row=2, col=2)
+    fig_perf.add_trace(scatter(performance_data['Year'], performance_data['Customer_Satisfaction']*20,
+                                webgl_threshold=webgl_threshold,
+                                mode='lines', name='Customer Satisfaction (x20)', line=dict(color='orange')),
+                     row=2, col=2, secondary_y=True)
+
+    fig_perf.update_layout(height=600, title_text="Zappos Performance Metrics Post-Acquisition")
+    return fig_perf
+
+
+def render():
+    st.markdown('<div class="section-header">Performance Metrics</div>', unsafe_allow_html=True)
+
+    # The chart fills in once built; the KPIs below do not wait for it
+    charts = ChartSlots(__name__)
+    charts.chart(build_performance, width="stretch")
+
+    # Key performance indicators
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Revenue Growth (2009-2015)", "100%", "From $1B to $2B+")
+        st.metric("Stock Price ROI", "736%", "Amazon stock appreciation")
+
+    with col2:
+        st.metric("Employee Retention", "~85%", "Post-acquisition average")
+        st.metric("Cultural Score Retention", "87%", "Of original culture metrics")
+
+    with col3:
+        st.metric("Market Share Growth", "+23%", "In online footwear")
+        st.metric("Customer NPS", "75+", "Industry leading score")
+
+    # References
+    st.markdown("**References:**")
+    st.markdown("""
+    - Zappos Annual Reports. (2009-2023). Revenue and Employee Data.
+    - Net Promoter Score Surveys. (2015). Zappos Customer Satisfaction.
+    - MarketWatch. (2015). Online Footwear Market Share Analysis.
+    """)
+
+    charts.fill()
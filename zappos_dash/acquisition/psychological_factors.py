@@ -0,0 +1,66 @@
+"""Psychological Factors page of the acquisition dashboard."""
+import streamlit as st
+import plotly.express as px
+
+from zappos_dash.charts import journey_figure, to_long
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import plotly_chart
+
+
+def build_psych_journey():
+    # Psychological factors analysis
+    psych_factors = load_dataset('acquisition/psych_factors')
+
+    # Psychological journey visualization
+    phases = ['Pre-Acquisition', 'Transition Period', 'Post-Integration']
+    psych_long = to_long(psych_factors, 'Factor',
+                         ['Pre_Acquisition', 'Transition_Period', 'Post_Integration'], phases)
+    fig_psych = journey_figure(psych_long, title='Psychological Factors Journey', height=500)
+    return fig_psych
+
+
+def build_impact():
+    impact_scores = load_dataset('acquisition/stakeholder_impact')
+
+    fig_impact = px.bar(impact_scores, x='Stakeholder', y=['Positive Impact', 'Negative Impact'],
+                      title='Psychological Impact on Stakeholders', barmode='group')
+    return fig_impact
+
+
+def render():
+    st.markdown('<div class="section-header">Psychological Analysis</div>', unsafe_allow_html=True)
+
+    fig_psych = cached_figure(__name__, build_psych_journey)
+    plotly_chart(fig_psych, width="stretch")
+
+    # Decision-making analysis
+    st.subheader("🤔 Key Decision-Making Analysis")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="insight-box">
+            <h4>Tony Hsieh's Strategic Decisions</h4>
+            <ul>
+                <li><strong>Stock vs Cash:</strong> Chose Amazon stock over cash - proved highly profitable</li>
+                <li><strong>Staying as CEO:</strong> Maintained leadership continuity despite acquisition pressures</li>
+                <li><strong>Cultural Preservation:</strong> Negotiated operational independence to maintain Zappos culture</li>
+                <li><strong>Transparent Communication:</strong> Published explanation in Inc. magazine to maintain trust</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Psychological impact scores
+        fig_impact = cached_figure(__name__, build_impact)
+        plotly_chart(fig_impact)
+
+    # References
+    st.markdown("**References:**")
+    st.markdown("""
+    - Inc. Magazine. (2009). Tony Hsieh's Acquisition Letter.
+    - Psychology Today. (2010). Psychological Impact of M&A.
+    - Zappos Insights. (2011). Employee Morale Survey.
+    """)
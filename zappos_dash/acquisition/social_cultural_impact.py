@@ -0,0 +1,102 @@
+"""Social & Cultural Impact page of the acquisition dashboard."""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from zappos_dash.charts import aggregate
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash import vega
+from zappos_dash.profiling import altair_chart, plotly_chart
+
+
+# Phase column -> line colour
+CULTURAL_PHASES = {
+    'Before Acquisition': 'green',
+    'After Acquisition (2015)': 'orange',
+    'Current Status (2023)': 'red',
+}
+
+
+def cultural_means(cultural_metrics):
+    """Mean score per aspect and phase; what both renderers draw."""
+    return aggregate(cultural_metrics, 'Aspect', list(CULTURAL_PHASES), 'mean')
+
+
+def cultural_figure(cultural_metrics):
+    # Multi-line chart for cultural evolution
+    fig_cultural = go.Figure()
+
+    for phase, color in CULTURAL_PHASES.items():
+        fig_cultural.add_trace(go.Scatter(x=cultural_metrics['Aspect'], y=cultural_metrics[phase],
+                                        mode='lines+markers', name=phase, line=dict(color=color)))
+
+    fig_cultural.update_layout(title='Cultural Metrics Evolution Over Time',
+                             xaxis_tickangle=-45, height=400)
+    return fig_cultural
+
+
+def cultural_chart(cultural_metrics):
+    # Same chart as cultural_figure, from the same per-aspect means
+    long = cultural_metrics.melt(id_vars='Aspect', var_name='Phase', value_name='Score')
+    return vega.line_chart(long, x='Aspect', y='Score', color='Phase',
+                           title='Cultural Metrics Evolution Over Time',
+                           colors=CULTURAL_PHASES, x_label_angle=-45)
+
+
+def build_cultural():
+    # Cultural preservation metrics
+    return cultural_figure(cultural_means(load_dataset('acquisition/cultural_metrics')))
+
+
+def build_cultural_vega():
+    return cultural_chart(cultural_means(load_dataset('acquisition/cultural_metrics')))
+
+
+def build_employee_impact():
+    employee_data = load_dataset('acquisition/employee_impact')
+    fig_emp = px.bar(employee_data, x='Benefit', y='Impact Level',
+                    title='Employee Benefits & Impact Scores')
+    fig_emp.update_layout(xaxis_tickangle=-45)
+    return fig_emp
+
+
+def build_challenges():
+    challenges = load_dataset('acquisition/cultural_challenges')
+
+    fig_challenges = px.scatter(challenges, x='Severity', y='Resolution Success',
+                              size='Size', color='Challenge',
+                              title='Cultural Integration Challenges')
+    return fig_challenges
+
+
+def render():
+    st.markdown('<div class="section-header">Social & Cultural Impact</div>', unsafe_allow_html=True)
+
+    if vega.enabled():
+        chart_cultural = cached_figure(__name__, build_cultural_vega)
+        altair_chart(chart_cultural, width="stretch")
+    else:
+        fig_cultural = cached_figure(__name__, build_cultural)
+        plotly_chart(fig_cultural, width="stretch")
+
+    # Employee impact analysis
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("👥 Employee Impact")
+        fig_emp = cached_figure(__name__, build_employee_impact)
+        plotly_chart(fig_emp)
+
+    with col2:
+        st.subheader("🌟 Cultural Challenges")
+        fig_challenges = cached_figure(__name__, build_challenges)
+        plotly_chart(fig_challenges)
+
+    # References
+    st.markdown("**References:**")
+    st.markdown("""
+    - Zappos Insights. (2015). Cultural Preservation Report.
+    - Glassdoor. (2015-2023). Employee Satisfaction Surveys.
+    - Forbes. (2010). Zappos Cultural Integration Case Study.
+    """)
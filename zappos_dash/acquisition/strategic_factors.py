@@ -0,0 +1,84 @@
+"""Strategic Factors page of the acquisition dashboard."""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from zappos_dash.data import load_acquisition_data, load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import plotly_chart
+
+
+def build_radar():
+    _, _, _, df_success = load_acquisition_data()
+    fig_radar = go.Figure()
+
+    fig_radar.add_trace(go.Scatterpolar(
+        r=df_success['Impact Score'],
+        theta=df_success['Factor'],
+        fill='toself',
+        name='Strategic Success Factors',
+        line_color='#FF9900'
+    ))
+
+    fig_radar.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )),
+        showlegend=True,
+        title="Strategic Success Factors Analysis",
+        height=500
+    )
+    return fig_radar
+
+
+def build_synergy():
+    strategic_fit = load_dataset('acquisition/strategic_fit')
+
+    fig_synergy = px.bar(strategic_fit, x='Synergy Score', y='Amazon Strengths',
+                       title='Strategic Synergies',
+                       orientation='h', color='Synergy Score',
+                       color_continuous_scale='viridis')
+    return fig_synergy
+
+
+def build_market():
+    market_data = load_dataset('acquisition/market_position')
+
+    fig_market = px.scatter(market_data, x='Pre-Acquisition', y='Post-Acquisition',
+                          size='Size', color='Segment',
+                          title='Market Position: Before vs After')
+    fig_market.add_shape(type="line", x0=0, y0=0, x1=100, y1=100,
+                       line=dict(dash="dash", color="gray"))
+    return fig_market
+
+
+def render():
+    st.markdown('<div class="section-header">Strategic Analysis</div>', unsafe_allow_html=True)
+
+    # Success factors radar chart
+    fig_radar = cached_figure(__name__, build_radar)
+    plotly_chart(fig_radar, width="stretch")
+
+    # Strategic alignment matrix
+    st.subheader("🎯 Strategic Alignment Matrix")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig_synergy = cached_figure(__name__, build_synergy)
+        plotly_chart(fig_synergy)
+
+    with col2:
+        # Market positioning
+        fig_market = cached_figure(__name__, build_market)
+        plotly_chart(fig_market)
+
+    # References
+    st.markdown("**References:**")
+    st.markdown("""
+    - Harvard Business Review. (2010). Amazon-Zappos Strategic Alignment Case Study.
+    - Zappos Insights. (2009). Strategic Synergies Report.
+    - McKinsey & Company. (2011). E-commerce Market Positioning Analysis.
+    """)
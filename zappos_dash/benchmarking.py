@@ -0,0 +1,96 @@
+"""Competitor x metric benchmarking.
+
+A benchmark dataset has a ``Metric`` column and one column per competitor,
+plus an optional boolean ``Higher_Is_Better`` column; metrics it marks
+False (days to deliver, cost, ...) score best at their lowest value.
+Scores are normalized per metric, across competitors, so a metric in days
+is never scaled against one in percent. All metrics are processed in one
+vectorized pass and the result is cached per dataset version.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from zappos_dash.data import SOURCES, dataset_version
+
+METHODS = {
+    'range': '% of range (worst to best)',
+    'percentile': 'Percentile rank',
+}
+
+DIRECTION = 'Higher_Is_Better'
+
+
+def min_max_scale(values):
+    """Each value scaled to 0-100 between the lowest and highest of its row.
+
+    A row whose values are all equal scores 100 throughout; NaNs stay NaN
+    and an all-NaN row stays all NaN.
+    """
+    valid = ~np.isnan(values)
+    low = np.where(valid, values, np.inf).min(axis=1, keepdims=True)
+    high = np.where(valid, values, -np.inf).max(axis=1, keepdims=True)
+    span = high - low
+    spread = span > 0
+    scaled = np.where(spread, 100 * (values - low) / np.where(spread, span, 1), 100.0)
+    return np.where(valid, scaled, np.nan)
+
+
+def percentile_rank(values):
+    """Percentile rank (0-100) of each value within its row.
+
+    The lowest value of a row ranks 0 and the highest 100; ties share the
+    mean of their ranks and NaNs stay NaN.
+    """
+    n_rows, n_cols = values.shape
+    order = np.argsort(values, axis=1, kind='stable')
+    ordered = np.take_along_axis(values, order, axis=1)
+
+    # First and last position of each run of equal values in a sorted row
+    positions = np.broadcast_to(np.arange(n_cols), (n_rows, n_cols))
+    starts = np.ones((n_rows, n_cols), dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    ends = np.ones((n_rows, n_cols), dtype=bool)
+    ends[:, :-1] = starts[:, 1:]
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=1)
+    last = np.minimum.accumulate(np.where(ends, positions, n_cols)[:, ::-1], axis=1)[:, ::-1]
+
+    valid = (~np.isnan(values)).sum(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ranks = np.where(valid > 1, 100 * (first + last) / 2 / (valid - 1), 100.0)
+    ranks[np.isnan(ordered)] = np.nan
+
+    result = np.empty_like(ranks)
+    np.put_along_axis(result, order, ranks, axis=1)
+    return result
+
+
+NORMALIZERS = {'range': min_max_scale, 'percentile': percentile_rank}
+
+
+def normalize(values, method='range', higher_is_better=None):
+    """Scores of a ``metric x competitor`` array by ``method``, 100 being best.
+
+    ``higher_is_better`` holds one flag per metric (all True by default);
+    a metric flagged False is normalized on its negated values.
+    """
+    if higher_is_better is not None:
+        values = np.where(np.asarray(higher_is_better, dtype=bool)[:, None], values, -values)
+    return NORMALIZERS[method](values)
+
+
+def benchmark_scores(name, method='range'):
+    """Normalized ``Metric x competitor`` scores of benchmark dataset ``name``."""
+    return _scores(SOURCES[name], name, dataset_version(name), method)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _scores(_source, name, version, method):
+    matrix = _source.load().set_index('Metric')
+    higher_is_better = None
+    if DIRECTION in matrix:
+        higher_is_better = matrix[DIRECTION].astype(bool).to_numpy()
+        matrix = matrix.drop(columns=DIRECTION)
+    values = matrix.to_numpy(dtype=float)
+    return pd.DataFrame(normalize(values, method, higher_is_better),
+                        index=matrix.index, columns=matrix.columns)
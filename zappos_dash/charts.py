@@ -0,0 +1,95 @@
+"""Figure builders shared by several dashboard pages."""
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Above this many series, draw them as one WebGL trace instead of one
+# SVG trace (and legend entry) per series.
+MAX_SERIES_TRACES = 50
+
+# Line/marker traces with more points than this are drawn with WebGL
+# (Scattergl) instead of SVG. benchmarks/webgl_crossover.py measures where
+# WebGL starts to render faster in a given browser.
+WEBGL_POINT_THRESHOLD = int(os.environ.get("ZAPPOS_WEBGL_THRESHOLD", 1000))
+
+
+def scatter(x, y, webgl_threshold=None, **kwargs):
+    """``go.Scatter`` for short series, ``go.Scattergl`` above the threshold.
+
+    Both accept the same colour, marker and hover arguments and can be
+    placed on a ``secondary_y`` axis, so callers can switch freely.
+    """
+    if webgl_threshold is None:
+        webgl_threshold = WEBGL_POINT_THRESHOLD
+    trace = go.Scattergl if len(y) > webgl_threshold else go.Scatter
+    return trace(x=x, y=y, **kwargs)
+
+
+def revenue_line(frame, **kwargs):
+    """Yearly ``Revenue_Million`` of a revenue dataset as a line chart."""
+    return px.line(frame, x='Year', y='Revenue_Million', **kwargs)
+
+
+def employees_area(frame, **kwargs):
+    """Yearly ``Employees`` of a revenue dataset as an area chart."""
+    return px.area(frame, x='Year', y='Employees', **kwargs)
+
+
+def aggregate(frame, by, values, how='sum'):
+    """``frame`` reduced to one row per ``by`` group, in first-seen order."""
+    return frame.groupby(by, sort=False, observed=True)[values].agg(how).reset_index()
+
+
+def to_long(frame, id_col, value_cols, phase_labels, phase_col='Phase', value_col='Score'):
+    """Reshape a wide ``id x phase`` frame into long ``(id, phase, score)`` rows."""
+    long = frame.melt(id_vars=id_col, value_vars=value_cols,
+                      var_name=phase_col, value_name=value_col)
+    long[phase_col] = pd.Categorical(
+        long[phase_col].map(dict(zip(value_cols, phase_labels))),
+        categories=phase_labels, ordered=True)
+    return long
+
+
+def journey_figure(long, id_col='Factor', phase_col='Phase', value_col='Score', **layout):
+    """Build a line-per-series journey chart from long-format rows.
+
+    The rows are scattered into a ``series x phase`` matrix in one
+    vectorized pass, whatever their order; missing pairs stay NaN and rows
+    without a series or phase are left out. Up to
+    ``MAX_SERIES_TRACES`` series get their own trace; beyond that all
+    series are drawn as a single ``Scattergl`` trace broken by gaps, which
+    keeps the browser responsive with thousands of series.
+    """
+    codes, names = pd.factorize(long[id_col])
+    phases = long[phase_col]
+    if isinstance(phases.dtype, pd.CategoricalDtype):
+        phase_codes = phases.cat.codes.to_numpy()
+        phase_labels = list(phases.cat.categories)
+    else:
+        phase_codes, phase_labels = pd.factorize(phases)
+        phase_labels = list(phase_labels)
+
+    # A missing series or phase has code -1, which would index the last row
+    known = (codes >= 0) & (phase_codes >= 0)
+    values = np.full((len(names), len(phase_labels)), np.nan)
+    values[codes[known], phase_codes[known]] = long[value_col].to_numpy(dtype=float)[known]
+
+    fig = go.Figure()
+    if len(names) <= MAX_SERIES_TRACES:
+        for name, row in zip(names, values):
+            fig.add_trace(go.Scatter(x=phase_labels, y=row, mode='lines+markers', name=name))
+    else:
+        # One NaN column per series separates the polylines
+        n_points = len(phase_labels) + 1
+        y = np.column_stack([values, np.full(len(names), np.nan)]).ravel()
+        x = np.tile(np.array(phase_labels + [None], dtype=object), len(names))
+        text = np.repeat(np.asarray(names, dtype=object), n_points)
+        fig.add_trace(go.Scattergl(
+            x=x, y=y, text=text, mode='lines', name=f'{len(names)} series',
+            line=dict(width=1), opacity=0.4,
+            hovertemplate='%{text}<br>%{x}: %{y}<extra></extra>'))
+    fig.update_layout(**layout)
+    return fig
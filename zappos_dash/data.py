@@ -0,0 +1,221 @@
+"""Versioned, process-wide datasets for the dashboards.
+
+Every dataset is read through a :class:`~zappos_dash.sources.DataSource`
+registered in ``SOURCES``. Frames are loaded once per file content and
+kept in Streamlit's resource cache, so every session and every rerun reads
+the same objects until the file on disk changes. :func:`record_reads`
+collects the datasets a block of code reads, so a figure can be keyed on
+the versions of its own sources only.
+"""
+import hashlib
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from zappos_dash.profiling import section
+from zappos_dash.sources import DataSource
+
+# Copy-on-write makes shallow copies of the shared frames safe to hand out:
+# a page that writes to its copy never touches the cached original.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+SOURCES = {source.name: source for source in [
+    # Amazon-Zappos acquisition dashboard
+    DataSource("acquisition/financial"),
+    DataSource("acquisition/timeline", parse_dates=["Date"]),
+    DataSource("acquisition/valuation"),
+    DataSource("acquisition/success_factors"),
+    DataSource("acquisition/financial_details"),
+    DataSource("acquisition/strategic_fit"),
+    DataSource("acquisition/market_position"),
+    DataSource("acquisition/cultural_metrics"),
+    DataSource("acquisition/employee_impact"),
+    DataSource("acquisition/cultural_challenges"),
+    DataSource("acquisition/psych_factors"),
+    DataSource("acquisition/stakeholder_impact"),
+    DataSource("acquisition/performance"),
+    DataSource("acquisition/success_analysis"),
+    # Daily share-price-implied deal value, one row per (Date, Series)
+    DataSource("acquisition/deal_value_daily", parse_dates=["Date"], optional=True),
+    # Tony Hsieh leadership dashboard
+    DataSource("leadership/career_timeline"),
+    DataSource("leadership/traits"),
+    DataSource("leadership/styles"),
+    DataSource("leadership/lessons"),
+    DataSource("leadership/revenue"),
+    DataSource("leadership/transformation_phases"),
+    DataSource("leadership/milestones"),
+    DataSource("leadership/org_hierarchy"),
+    DataSource("leadership/holacracy_circles"),
+    DataSource("leadership/holacracy_rollout"),
+    DataSource("leadership/holacracy_impact"),
+    DataSource("leadership/financials"),
+    DataSource("leadership/customer_satisfaction"),
+    DataSource("leadership/competitors"),
+    DataSource("leadership/core_values"),
+    DataSource("leadership/offer_program"),
+    DataSource("leadership/principles"),
+    DataSource("leadership/evolution"),
+    DataSource("leadership/effectiveness"),
+    DataSource("leadership/success_factors"),
+    # Tony Hsieh & Zappos journey dashboard
+    DataSource("journey/revenue", sort_by="Year"),
+    DataSource("journey/holacracy"),
+    DataSource("journey/principles"),
+    DataSource("journey/milestones", sort_by="Year"),
+    DataSource("journey/core_values"),
+    DataSource("journey/leadership_scores"),
+    DataSource("journey/paradoxes"),
+    DataSource("journey/leadership_timeline"),
+    DataSource("journey/benchmarks"),
+    DataSource("journey/roi"),
+    DataSource("journey/lessons"),
+    DataSource("journey/recommendations"),
+]}
+
+
+# Columns derived from a registered dataset, computed once per version of
+# its file: {dataset: {column: function(frame) -> Series}}
+DERIVED = {
+    "journey/revenue": {
+        "Revenue_Per_Employee": lambda df: df["Revenue_Million"] * 1000000 / df["Employees"],
+    },
+}
+
+
+_reads = threading.local()
+
+
+@contextmanager
+def record_reads():
+    """Collect the names of the datasets read inside the block.
+
+    Yields a set that is filled as datasets are loaded, checked or
+    versioned on this thread; reads of a nested block count for the outer
+    one too.
+    """
+    stack = _reads.__dict__.setdefault("stack", [])
+    names = set()
+    stack.append(names)
+    try:
+        yield names
+    finally:
+        stack.pop()
+        if stack:
+            stack[-1].update(names)
+
+
+def _note_read(name):
+    stack = getattr(_reads, "stack", None)
+    if stack:
+        stack[-1].add(name)
+
+
+def dataset_version(name):
+    """Content version of dataset ``name``, noted as read by the caller."""
+    _note_read(name)
+    return SOURCES[name].version()
+
+
+def source_versions(names):
+    """``((name, version), ...)`` of the datasets ``names``, sorted by name."""
+    return tuple((name, SOURCES[name].version()) for name in sorted(names))
+
+
+def versions_current(versions):
+    """Whether every ``(name, version)`` pair still matches its file."""
+    return all(SOURCES[name].version() == version for name, version in versions)
+
+
+def data_version(names=None):
+    """Short hash that changes whenever one of the ``names`` data files changes.
+
+    ``names`` defaults to every registered dataset.
+    """
+    digest = hashlib.sha1()
+    for name in sorted(SOURCES if names is None else names):
+        digest.update(SOURCES[name].version().encode())
+    return digest.hexdigest()[:12]
+
+
+def load_dataset(name):
+    """Return the registered dataset ``name`` as a DataFrame.
+
+    The frame is shared across sessions; callers get a shallow
+    copy-on-write view, so no data is copied unless a caller writes.
+    """
+    _note_read(name)
+    with section("data", name):
+        return SOURCES[name].load().copy(deep=False)
+
+
+def load_derived(name):
+    """Return dataset ``name`` with its ``DERIVED`` columns added.
+
+    The columns are computed once per data version and shared like the
+    base frame: callers get a shallow copy-on-write view whose arrays are
+    read-only, so a rerun neither recomputes nor copies anything.
+    """
+    _note_read(name)
+    source = SOURCES[name]
+    with section("data", name):
+        return _derived_frame(source, name, source.version()).copy(deep=False)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _derived_frame(_source, name, version):
+    # Base columns share the cached frame's buffers; only new ones allocate
+    frame = _source.load().copy(deep=False)
+    for column, compute in DERIVED[name].items():
+        frame[column] = compute(frame)
+    return frame
+
+
+def journey_years():
+    """First and last year covered by the journey revenue and milestone data."""
+    years = pd.concat([load_dataset("journey/revenue")["Year"],
+                       load_dataset("journey/milestones")["Year"]])
+    return int(years.min()), int(years.max())
+
+
+def select_years(frame, year_range, column="Year"):
+    """Rows of ``frame`` whose ``column`` lies in the inclusive ``year_range``.
+
+    ``frame`` must be sorted by ``column`` (register its source with
+    ``sort_by``). Both bounds are found by binary search and the result is
+    a zero-copy slice; ``year_range=None`` returns ``frame`` unchanged.
+    """
+    if year_range is None:
+        return frame
+    start, end = year_range
+    years = frame[column].to_numpy()
+    if np.issubdtype(years.dtype, np.datetime64):
+        start = np.datetime64(f"{start}-01-01")
+        end = np.datetime64(f"{end + 1}-01-01")
+        stop = years.searchsorted(end, side="left")
+    else:
+        stop = years.searchsorted(end, side="right")
+    return frame.iloc[years.searchsorted(start, side="left"):stop]
+
+
+def has_dataset(name):
+    """Whether the file behind dataset ``name`` is present."""
+    _note_read(name)
+    return SOURCES[name].exists()
+
+
+def load_acquisition_data():
+    """Return the financial, timeline, valuation and success-factor frames."""
+    return tuple(load_dataset(name) for name in (
+        "acquisition/financial", "acquisition/timeline",
+        "acquisition/valuation", "acquisition/success_factors"))
+
+
+def load_journey_data():
+    """Return the revenue (with derived metrics), holacracy and principle frames."""
+    return (load_derived("journey/revenue"), load_dataset("journey/holacracy"),
+            load_dataset("journey/principles"))
@@ -0,0 +1,108 @@
+"""Server-side downsampling of dense line series.
+
+Both methods keep the first and last point of the requested x-range and
+return at most ``n_out`` points, so what is sent to the browser is bounded
+by the point budget rather than by how much history has been loaded.
+"""
+import numpy as np
+
+# Points per series sent to the browser for dense time series
+MAX_POINTS = 2000
+
+METHODS = {
+    'lttb': 'Largest-Triangle-Three-Buckets',
+    'minmax': 'Min/max per bucket',
+}
+
+
+def visible_slice(x, start=None, end=None):
+    """Index slice of the sorted array ``x`` that lies within ``[start, end]``."""
+    lo = 0 if start is None else int(np.searchsorted(x, start, side='left'))
+    hi = len(x) if end is None else int(np.searchsorted(x, end, side='right'))
+    return slice(lo, hi)
+
+
+def lttb_indices(x, y, n_out):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    The interior points are split into ``n_out - 2`` equal-count buckets;
+    from each bucket the point forming the largest triangle with the
+    previously kept point and the next bucket's average is kept.
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts = edges[:-1]
+    # Average point of every bucket, plus the last point as the final target
+    avg_x = np.append(np.add.reduceat(x[1:-1], starts - 1) / np.diff(edges), x[-1])
+    avg_y = np.append(np.add.reduceat(y[1:-1], starts - 1) / np.diff(edges), y[-1])
+
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i, (lo, hi) in enumerate(zip(starts, edges[1:])):
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - avg_x[i + 1]) * (y[lo:hi] - ay)
+                      - (ax - x[lo:hi]) * (avg_y[i + 1] - ay))
+        a = lo + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+
+def minmax_indices(y, n_out):
+    """Indices of the minimum and maximum of equal-count buckets.
+
+    Keeps every spike, which LTTB may smooth away; fully vectorized.
+    """
+    n = len(y)
+    if n <= n_out or n_out < 4:
+        return np.arange(n)
+
+    interior = y[1:-1]
+    size = -(-len(interior) // ((n_out - 2) // 2))
+    n_buckets = -(-len(interior) // size)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:len(interior)] = interior
+    buckets = padded.reshape(n_buckets, size)
+
+    offsets = np.arange(n_buckets) * size
+    lows = offsets + np.argmin(np.where(np.isnan(buckets), np.inf, buckets), axis=1)
+    highs = offsets + np.argmax(np.where(np.isnan(buckets), -np.inf, buckets), axis=1)
+    inner = np.unique(np.concatenate([lows, highs]))
+    inner = inner[inner < len(interior)] + 1
+    return np.concatenate([[0], inner, [n - 1]])
+
+
+def downsample(x, y, n_out=MAX_POINTS, method='lttb', start=None, end=None):
+    """Restrict a sorted series to ``[start, end]`` and reduce it to ``n_out`` points.
+
+    ``x`` may be numeric or datetime64 and must be sorted ascending; rows
+    with a missing ``y`` are dropped. Returns ``(x, y)`` as NumPy arrays.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    if start is not None and np.issubdtype(x.dtype, np.datetime64):
+        start = np.datetime64(start)
+    if end is not None and np.issubdtype(x.dtype, np.datetime64):
+        end = np.datetime64(end)
+
+    window = visible_slice(x, start, end)
+    x, y = x[window], y[window]
+    present = ~np.isnan(y)
+    if not present.all():
+        x, y = x[present], y[present]
+    if len(y) <= n_out:
+        return x, y
+
+    if method == 'lttb':
+        # Work in float offsets from the first x so datetimes keep precision
+        xf = (x - x[0]).astype(np.float64) if np.issubdtype(x.dtype, np.datetime64) \
+            else x.astype(np.float64)
+        idx = lttb_indices(xf, y, n_out)
+    elif method == 'minmax':
+        idx = minmax_indices(y, n_out)
+    else:
+        raise ValueError(f"Unknown downsampling method {method!r}; expected one of {list(METHODS)}")
+    return x[idx], y[idx]
@@ -0,0 +1,99 @@
+"""ZIP export of the journey datasets behind the sidebar download button.
+
+The archive holds every table as CSV and Parquet. Nothing is built until
+the button is clicked; the archive is then written to disk table by
+table and kept there, once per version of the exported datasets and year
+range. Each click reads the finished archive into memory, where
+Streamlit's media file manager holds it for the download.
+"""
+import io
+import os
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+
+from zappos_dash.data import data_version, load_dataset, load_journey_data, select_years
+
+EXPORT_DIR = Path(os.environ.get(
+    "ZAPPOS_EXPORT_DIR", Path(tempfile.gettempdir()) / "zappos_exports"))
+
+# Datasets the archive is built from; its name changes with their versions
+EXPORT_SOURCES = ("journey/revenue", "journey/holacracy", "journey/principles",
+                  "journey/milestones")
+
+_lock = threading.Lock()
+
+
+def export_tables(year_range=None):
+    """``{name: frame}`` of everything in the export, filtered views last."""
+    revenue_data, holacracy_data, principles_data = load_journey_data()
+    tables = {
+        'revenue_data': revenue_data,
+        'holacracy_data': holacracy_data,
+        'principles_data': principles_data,
+    }
+    if year_range is not None:
+        start, end = year_range
+        tables[f'revenue_data_{start}_{end}'] = select_years(revenue_data, year_range)
+        tables[f'milestones_{start}_{end}'] = select_years(
+            load_dataset('journey/milestones'), year_range)
+    return tables
+
+
+def export_name(year_range=None, version=None):
+    version = version or data_version(EXPORT_SOURCES)
+    suffix = f"_{year_range[0]}-{year_range[1]}" if year_range is not None else ""
+    return f"zappos_analysis_{version}{suffix}.zip"
+
+
+def write_zip(path, tables):
+    """Write ``tables`` into a ZIP at ``path``, one compressed entry at a time."""
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, frame in tables.items():
+            with archive.open(f"csv/{name}.csv", 'w', force_zip64=True) as raw, \
+                    io.TextIOWrapper(raw, encoding='utf-8', newline='') as text:
+                frame.to_csv(text, index=False)
+            with archive.open(f"parquet/{name}.parquet", 'w', force_zip64=True) as raw:
+                frame.to_parquet(raw, index=False)
+
+
+def build_archive(path, year_range, version):
+    """Write the archive to ``path`` through a temporary file of its own."""
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    # A unique temporary name, so replicas sharing EXPORT_DIR never write
+    # to the same file; the rename makes the finished archive appear at once
+    with tempfile.NamedTemporaryFile(dir=EXPORT_DIR, prefix=f"{path.stem}.",
+                                     suffix='.part', delete=False) as tmp:
+        partial = Path(tmp.name)
+    try:
+        write_zip(partial, export_tables(year_range))
+        os.replace(partial, path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    # Archives of older data versions are never served again
+    for old in EXPORT_DIR.glob('zappos_analysis_*.zip'):
+        if not old.name.startswith(f"zappos_analysis_{version}"):
+            old.unlink(missing_ok=True)
+
+
+def export_file(year_range=None, attempts=3):
+    """Bytes of the export ZIP for the current data, building it on first use.
+
+    Another process sharing ``EXPORT_DIR`` may remove the archive between
+    the check and the read, when it serves newer data; the version is
+    then taken again and the archive rebuilt, up to ``attempts`` times.
+    """
+    for attempt in range(attempts):
+        version = data_version(EXPORT_SOURCES)
+        path = EXPORT_DIR / export_name(year_range, version)
+        with _lock:
+            if not path.exists():
+                build_archive(path, year_range, version)
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            if attempt == attempts - 1:
+                raise
@@ -0,0 +1,193 @@
+"""Process-wide LRU cache of built Plotly figures.
+
+Figures are keyed by page, builder and the widget values they depend on,
+and each one remembers the versions of the datasets its builder read. A
+rerun that changes none of those gets the already-built figure back
+instead of constructing it again; editing one data file rebuilds only
+the figures built from it. Cached figures are shared between sessions
+and must be treated as read-only by callers.
+
+The cache also accounts for which session uses which figure. Each
+session may hold up to ``SESSION_MEMORY_LIMIT`` bytes of figures; beyond
+that its least recently used figures are released and evicted unless
+another session still uses them. Sessions that have disconnected are
+forgotten every ``SESSION_PRUNE_SECONDS`` and before an eviction, so
+they neither grow the accounting nor keep figures alive.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+from streamlit.runtime import Runtime, exists
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from zappos_dash.data import record_reads, source_versions, versions_current
+from zappos_dash.prebake import load_prebaked
+from zappos_dash.profiling import section
+
+# Upper bound on figures kept across all pages, parameters and sessions
+MAX_FIGURES = 256
+
+# Figure bytes (serialized size) one session may keep cached
+SESSION_MEMORY_LIMIT = int(float(os.environ.get("ZAPPOS_SESSION_MEMORY_MB", 64)) * 2**20)
+
+# Seconds between sweeps of the sessions that have disconnected
+SESSION_PRUNE_SECONDS = 60
+
+
+def session_active(session):
+    """Whether ``session`` is still connected; always True without a runtime."""
+    return not exists() or Runtime.instance().is_active_session(session)
+
+
+def figure_nbytes(fig):
+    """Approximate size of a figure: the length of its Plotly JSON."""
+    return len(fig.to_json())
+
+
+class FigureCache:
+    """Thread-safe LRU mapping of figure keys to built figures."""
+
+    def __init__(self, maxsize=MAX_FIGURES, session_limit=SESSION_MEMORY_LIMIT,
+                 is_active=session_active):
+        self.maxsize = maxsize
+        self.session_limit = session_limit
+        self.is_active = is_active
+        self.hits = 0
+        self.misses = 0
+        self._figures = OrderedDict()
+        self._sizes = {}
+        # Session id -> keys it has used, least recently used first
+        self._sessions = {}
+        self._pruned = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._figures)
+
+    @property
+    def nbytes(self):
+        return sum(self._sizes.values())
+
+    def get_or_build(self, key, build, session=None):
+        """The figure cached under ``key`` if its data is current, else ``build()``'s.
+
+        ``build`` returns ``(figure, versions)``, the ``(dataset, version)``
+        pairs the figure was built from.
+        """
+        with self._lock:
+            entry = self._figures.get(key)
+        # Version checks stat files, so they run outside the lock
+        if entry is not None and versions_current(entry[1]):
+            with self._lock:
+                if key in self._figures:
+                    self._figures.move_to_end(key)
+                self._use(session, key)
+                self.hits += 1
+            return entry[0]
+        with self._lock:
+            self.misses += 1
+
+        # Build outside the lock; two sessions racing on the same key just
+        # both build it and the last one wins. A stale entry is replaced.
+        fig, versions = build()
+        size = figure_nbytes(fig)
+        with self._lock:
+            self._figures[key] = (fig, versions)
+            self._figures.move_to_end(key)
+            self._sizes[key] = size
+            self._use(session, key)
+            while len(self._figures) > self.maxsize:
+                self._drop(next(iter(self._figures)))
+        return fig
+
+    def _use(self, session, key):
+        if session is None:
+            return
+        if time.monotonic() - self._pruned > SESSION_PRUNE_SECONDS:
+            self._prune()
+        used = self._sessions.setdefault(session, OrderedDict())
+        used[key] = None
+        used.move_to_end(key)
+        if len(used) > 1 and self._held_bytes(used) > self.session_limit:
+            # Disconnected sessions must not keep the released figures alive
+            self._prune()
+        while len(used) > 1 and self._held_bytes(used) > self.session_limit:
+            released, _ = used.popitem(last=False)
+            if not any(released in other for other in self._sessions.values()):
+                self._drop(released)
+
+    def _prune(self):
+        self._pruned = time.monotonic()
+        for session in [session for session in self._sessions if not self.is_active(session)]:
+            del self._sessions[session]
+
+    def _held_bytes(self, keys):
+        return sum(self._sizes.get(key, 0) for key in keys)
+
+    def _drop(self, key):
+        self._figures.pop(key, None)
+        self._sizes.pop(key, None)
+
+    def session_usage(self):
+        """``{session id: (figures, bytes)}`` for every session seen."""
+        with self._lock:
+            return {session: (sum(key in self._figures for key in used), self._held_bytes(used))
+                    for session, used in self._sessions.items()}
+
+    def prune_sessions(self):
+        """Stop accounting for disconnected sessions; their figures stay cached."""
+        with self._lock:
+            self._prune()
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+            self._sizes.clear()
+            self._sessions.clear()
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_cache():
+    return FigureCache()
+
+
+def figure_key(page, build, params):
+    return (page, build.__name__, tuple(sorted(params.items())))
+
+
+def build_figure(page, build, params):
+    """``(figure, versions of the datasets it was built from)``."""
+    # Figures without widget inputs may have been baked ahead of time
+    if not params:
+        baked = load_prebaked(page, build)
+        if baked is not None:
+            return baked
+    with record_reads() as names:
+        fig = build(**params)
+    return fig, source_versions(names)
+
+
+def get_figure(page, build, params, session=None):
+    """:func:`cached_figure` for callers outside the script thread.
+
+    ``session`` is the id of the session the figure is built for, or None
+    when it is built for no session in particular.
+    """
+    with section("figure", build.__name__):
+        key = figure_key(page, build, params)
+        return get_figure_cache().get_or_build(
+            key, lambda: build_figure(page, build, params), session=session)
+
+
+def cached_figure(page, build, **params):
+    """Return ``build(**params)``, reusing a cached figure when possible.
+
+    ``page`` is the page module's ``__name__``; ``params`` are the widget
+    values the figure depends on and become part of the cache key. On a
+    cache miss a current pre-baked spec is preferred over a live build.
+    """
+    ctx = get_script_run_ctx()
+    return get_figure(page, build, params, session=ctx.session_id if ctx is not None else None)
@@ -0,0 +1,12 @@
+"""Pages of the Tony Hsieh & Zappos journey dashboard (``new dashboard.py``)."""
+
+# Sidebar label -> page module; modules are imported only when selected
+PAGES = {
+    "🏠 Executive Summary": "zappos_dash.journey.executive_summary",
+    "📈 Financial Performance": "zappos_dash.journey.financial_performance",
+    "🎭 Cultural Impact": "zappos_dash.journey.cultural_impact",
+    "⚡ Holacracy Experiment": "zappos_dash.journey.holacracy_experiment",
+    "🎯 Leadership Style": "zappos_dash.journey.leadership_style",
+    "📊 Key Metrics": "zappos_dash.journey.key_metrics",
+    "🔍 Interpretations": "zappos_dash.journey.interpretations",
+}
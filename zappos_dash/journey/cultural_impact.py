@@ -0,0 +1,90 @@
+"""Cultural Impact page of the Zappos journey dashboard."""
+import streamlit as st
+import plotly.graph_objects as go
+
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import plotly_chart
+
+
+def build_radar():
+    core_values = load_dataset('journey/core_values')
+
+    fig_radar = go.Figure()
+
+    fig_radar.add_trace(go.Scatterpolar(
+        r=core_values['Implementation'],
+        theta=core_values['Value'],
+        fill='toself',
+        name='Implementation Score',
+        line_color='#1f77b4'
+    ))
+
+    fig_radar.add_trace(go.Scatterpolar(
+        r=core_values['Employee_Rating'],
+        theta=core_values['Value'],
+        fill='toself',
+        name='Employee Rating',
+        line_color='#ff7f0e'
+    ))
+
+    fig_radar.add_trace(go.Scatterpolar(
+        r=core_values['Business_Impact'],
+        theta=core_values['Value'],
+        fill='toself',
+        name='Business Impact',
+        line_color='#2ca02c'
+    ))
+
+    fig_radar.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 10]
+            )),
+        showlegend=True,
+        title="Core Values Performance Matrix",
+        height=600
+    )
+    return fig_radar
+
+
+def render():
+    st.header("🎭 Cultural Impact & Innovation")
+
+    # Core values radar chart
+    st.subheader("Zappos 10 Core Values Impact Assessment")
+
+    fig_radar = cached_figure(__name__, build_radar)
+    plotly_chart(fig_radar, width="stretch")
+
+    # Cultural initiatives
+    st.subheader("Cultural Initiatives & Results")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="insight-box">
+            <h4>🎓 "The Offer" Program Results</h4>
+            <ul>
+                <li><strong>$2,000-$5,000</strong> paid to quit after training</li>
+                <li><strong>~2-3%</strong> acceptance rate annually</li>
+                <li><strong>97%</strong> cultural fit retention rate</li>
+                <li><strong>Cultural Litmus Test</strong> effectiveness proven</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="insight-box">
+            <h4>📚 Culture Book Impact</h4>
+            <ul>
+                <li><strong>Annual Publication</strong> by employees</li>
+                <li><strong>100%</strong> voluntary participation</li>
+                <li><strong>External Recognition</strong> as best practice</li>
+                <li><strong>Cultural Reinforcement</strong> tool</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,91 @@
+"""Executive Summary page of the Zappos journey dashboard."""
+import streamlit as st
+
+from zappos_dash.charts import revenue_line
+from zappos_dash.data import load_journey_data
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import plotly_chart
+
+
+def build_timeline():
+    revenue_data, _, _ = load_journey_data()
+    timeline_fig = revenue_line(revenue_data, title='Zappos Revenue Growth Under Tony Hsieh',
+                                labels={'Revenue_Million': 'Revenue ($ Millions)', 'Year': 'Year'})
+    timeline_fig.add_annotation(x=2013, y=1900, text="Holacracy<br>Implementation",
+                               showarrow=True, arrowhead=2, arrowcolor="red")
+    timeline_fig.update_layout(height=400)
+    return timeline_fig
+
+
+def render():
+    st.header("Executive Summary")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>Revenue Growth</h3>
+            <h2>$2.1B</h2>
+            <p>Peak revenue in 2015</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>Growth Rate</h3>
+            <h2>420,000%</h2>
+            <p>From $0.5M to $2.1B</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>Employee Count</h3>
+            <h2>1,450</h2>
+            <p>At peak in 2015</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown("""
+        <div class="negative-metric">
+            <h3>Holacracy Exodus</h3>
+            <h2>18%</h2>
+            <p>Employee departure rate</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("🎯 Key Leadership Innovations")
+        st.markdown("""
+        <div class="leadership-principle">
+            <strong>Holacracy Implementation (2013)</strong><br>
+            Revolutionary self-management system replacing traditional hierarchy
+        </div>
+        <div class="leadership-principle">
+            <strong>"The Offer" Program</strong><br>
+            $2,000-$5,000 paid to new hires to quit after training
+        </div>
+        <div class="leadership-principle">
+            <strong>Culture-First Hiring</strong><br>
+            Prioritized cultural fit over technical skills
+        </div>
+        <div class="leadership-principle">
+            <strong>Customer Service Revolution</strong><br>
+            365-day returns, no-script calls, unlimited time policy
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.subheader("📊 Business Impact Timeline")
+
+        # Timeline visualization
+        timeline_fig = cached_figure(__name__, build_timeline)
+        plotly_chart(timeline_fig, width="stretch")
@@ -0,0 +1,84 @@
+"""Financial Performance page of the Zappos journey dashboard."""
+import streamlit as st
+import plotly.express as px
+
+from zappos_dash import vega
+from zappos_dash.charts import aggregate, employees_area
+from zappos_dash.data import load_dataset, load_journey_data, select_years
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import altair_chart, plotly_chart
+
+
+def annual_revenue(revenue_data):
+    """Revenue summed per year; what both renderers draw."""
+    return aggregate(revenue_data, 'Year', 'Revenue_Million')
+
+
+def revenue_figure(revenue_data):
+    fig_revenue = px.bar(revenue_data, x='Year', y='Revenue_Million',
+                       title='Annual Revenue Growth',
+                       color='Revenue_Million',
+                       color_continuous_scale='Blues')
+    fig_revenue.update_layout(height=400)
+    return fig_revenue
+
+
+def revenue_chart(revenue_data):
+    return vega.bar_chart(revenue_data, x='Year', y='Revenue_Million',
+                          title='Annual Revenue Growth')
+
+
+def build_revenue(year_range=None):
+    return revenue_figure(annual_revenue(select_years(load_journey_data()[0], year_range)))
+
+
+def build_revenue_vega(year_range=None):
+    return revenue_chart(annual_revenue(select_years(load_journey_data()[0], year_range)))
+
+
+def build_employees(year_range=None):
+    revenue_data = select_years(load_journey_data()[0], year_range)
+    fig_employees = employees_area(revenue_data, title='Employee Growth Over Time',
+                                   color_discrete_sequence=['#ff6b6b'])
+    fig_employees.update_layout(height=400)
+    return fig_employees
+
+
+def build_efficiency(year_range=None):
+    # Revenue per employee analysis (derived once per data version)
+    revenue_data = select_years(load_journey_data()[0], year_range)
+
+    fig_efficiency = px.line(revenue_data, x='Year', y='Revenue_Per_Employee',
+                           title='Revenue per Employee Efficiency',
+                           labels={'Revenue_Per_Employee': 'Revenue per Employee ($)'})
+    return fig_efficiency
+
+
+def render(year_range=None):
+    st.header("📈 Financial Performance Analysis")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Revenue growth chart
+        if vega.enabled():
+            chart_revenue = cached_figure(__name__, build_revenue_vega, year_range=year_range)
+            altair_chart(chart_revenue, width="stretch")
+        else:
+            fig_revenue = cached_figure(__name__, build_revenue, year_range=year_range)
+            plotly_chart(fig_revenue, width="stretch")
+
+    with col2:
+        # Employee growth chart
+        fig_employees = cached_figure(__name__, build_employees, year_range=year_range)
+        plotly_chart(fig_employees, width="stretch")
+
+    # Performance metrics
+    st.subheader("Key Financial Milestones")
+
+    milestones = select_years(load_dataset('journey/milestones'), year_range)
+
+    st.dataframe(milestones, width="stretch")
+
+    fig_efficiency = cached_figure(__name__, build_efficiency, year_range=year_range)
+    plotly_chart(fig_efficiency, width="stretch")
@@ -0,0 +1,129 @@
+"""Holacracy Experiment page of the Zappos journey dashboard."""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from zappos_dash.data import load_journey_data
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import plotly_chart
+
+
+def build_satisfaction():
+    _, holacracy_data, _ = load_journey_data()
+    fig_satisfaction = px.line(holacracy_data, x='Period', y='Employee_Satisfaction',
+                             title='Employee Satisfaction During Holacracy Transition',
+                             markers=True)
+    fig_satisfaction.update_traces(line_color='#ff6b6b', line_width=3)
+    fig_satisfaction.update_layout(height=400)
+    return fig_satisfaction
+
+
+def build_metrics():
+    _, holacracy_data, _ = load_journey_data()
+    fig_metrics = make_subplots(specs=[[{"secondary_y": True}]])
+
+    fig_metrics.add_trace(
+        go.Scatter(x=holacracy_data['Period'], y=holacracy_data['Productivity_Index'],
+                  name='Productivity Index', line=dict(color='#1f77b4')),
+        secondary_y=False,
+    )
+
+    fig_metrics.add_trace(
+        go.Scatter(x=holacracy_data['Period'], y=holacracy_data['Innovation_Score'],
+                  name='Innovation Score', line=dict(color='#2ca02c')),
+        secondary_y=True,
+    )
+
+    fig_metrics.update_layout(title='Productivity vs Innovation During Holacracy')
+    fig_metrics.update_xaxes(title_text="Period")
+    fig_metrics.update_yaxes(title_text="Productivity Index", secondary_y=False)
+    fig_metrics.update_yaxes(title_text="Innovation Score", secondary_y=True)
+    return fig_metrics
+
+
+def render():
+    st.header("⚡ The Holacracy Experiment: Revolutionary Management")
+
+    # Holacracy timeline
+    st.subheader("Holacracy Implementation Timeline & Impact")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Employee satisfaction during holacracy
+        fig_satisfaction = cached_figure(__name__, build_satisfaction)
+        plotly_chart(fig_satisfaction, width="stretch")
+
+    with col2:
+        # Productivity and innovation
+        fig_metrics = cached_figure(__name__, build_metrics)
+        plotly_chart(fig_metrics, width="stretch")
+
+    # Holacracy statistics
+    st.subheader("Holacracy Impact Statistics")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            label="Employee Departure Rate",
+            value="18%",
+            delta="-6% vs industry average",
+            delta_color="inverse"
+        )
+
+    with col2:
+        st.metric(
+            label="Org Chart Changes",
+            value="50/day",
+            delta="Dynamic restructuring"
+        )
+
+    with col3:
+        st.metric(
+            label="Tech Department Loss",
+            value="20%",
+            delta="Critical talent exodus",
+            delta_color="inverse"
+        )
+
+    with col4:
+        st.metric(
+            label="Innovation Increase",
+            value="15%",
+            delta="Per city-size doubling theory"
+        )
+
+    # Holacracy pros and cons
+    st.subheader("Holacracy Analysis: Pros vs Cons")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="leadership-principle">
+            <h4>✅ Advantages</h4>
+            <ul>
+                <li><strong>Increased Innovation:</strong> 15% boost in creativity</li>
+                <li><strong>Employee Empowerment:</strong> Self-defined roles</li>
+                <li><strong>Reduced Bureaucracy:</strong> Faster decision-making</li>
+                <li><strong>Purpose-Driven Work:</strong> Mission alignment</li>
+                <li><strong>Adaptability:</strong> Rapid organizational changes</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="negative-metric">
+            <h4>❌ Challenges</h4>
+            <ul>
+                <li><strong>High Turnover:</strong> 18% employee departure</li>
+                <li><strong>Role Confusion:</strong> Unclear responsibilities</li>
+                <li><strong>Scalability Issues:</strong> Difficult to manage growth</li>
+                <li><strong>Informal Hierarchies:</strong> Power structures emerged</li>
+                <li><strong>Implementation Stress:</strong> Top-down forced change</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,165 @@
+"""Interpretations page of the Zappos journey dashboard."""
+import streamlit as st
+import plotly.express as px
+
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import plotly_chart
+
+
+def build_lessons():
+    lessons = load_dataset('journey/lessons')
+
+    fig_lessons = px.bar(lessons, x='Success_Probability', y='Lesson',
+                        orientation='h', title='Leadership Lesson Success Probability',
+                        color='Success_Probability', color_continuous_scale='RdYlGn')
+    return fig_lessons
+
+
+def build_recommendations():
+    recommendations = load_dataset('journey/recommendations')
+
+    # Color mapping for priority
+    color_map = {'High': '#ff6b6b', 'Medium': '#feca57', 'Low': '#48dbfb'}
+    recommendations['Color'] = recommendations['Priority'].map(color_map)
+
+    fig_recommendations = px.scatter(recommendations, x='Timeline', y='Expected_Impact',
+                                   size='Expected_Impact', color='Priority',
+                                   hover_data=['Recommendation'],
+                                   title='Strategic Recommendations: Priority vs Impact',
+                                   color_discrete_map=color_map)
+    return fig_recommendations
+
+
+def render():
+    st.header("🔍 Strategic Interpretations & Insights")
+
+    st.subheader("Executive Summary of Leadership Impact")
+
+    st.markdown("""
+    <div class="insight-box">
+        <h4>🎯 Key Success Factors</h4>
+        <p>Tony Hsieh's leadership at Zappos demonstrated that <strong>culture-driven business strategies</strong>
+        can achieve extraordinary financial results. The company's growth from $0.5M to $2.1B represents
+        one of the most successful culture-first business transformations in modern corporate history.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # SWOT Analysis
+    st.subheader("SWOT Analysis of Hsieh's Leadership")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="leadership-principle">
+            <h4>💪 Strengths</h4>
+            <ul>
+                <li><strong>Visionary Culture Building:</strong> Created sustainable competitive advantage</li>
+                <li><strong>Customer Obsession:</strong> Industry-leading satisfaction scores</li>
+                <li><strong>Employee Empowerment:</strong> High engagement and loyalty</li>
+                <li><strong>Innovation Mindset:</strong> Continuous experimentation</li>
+                <li><strong>Authentic Leadership:</strong> Genuine commitment to values</li>
+            </ul>
+        </div>
+
+        <div class="negative-metric">
+            <h4>⚠️ Weaknesses</h4>
+            <ul>
+                <li><strong>Scalability Challenges:</strong> Holacracy struggled with growth</li>
+                <li><strong>Cultural Rigidity:</strong> Excluded non-conforming employees</li>
+                <li><strong>Top-down Imposition:</strong> Contradicted empowerment message</li>
+                <li><strong>Operational Instability:</strong> Experiments disrupted workflows</li>
+                <li><strong>Succession Planning:</strong> Over-reliance on founder vision</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="leadership-principle">
+            <h4>🚀 Opportunities</h4>
+            <ul>
+                <li><strong>Global Expansion:</strong> Culture model could scale internationally</li>
+                <li><strong>Technology Integration:</strong> Digital tools for self-management</li>
+                <li><strong>Industry Influence:</strong> Consulting and training services</li>
+                <li><strong>Academic Partnerships:</strong> Leadership research collaboration</li>
+                <li><strong>Sustainable Practices:</strong> Environmental and social responsibility</li>
+            </ul>
+        </div>
+
+        <div class="negative-metric">
+            <h4>⚡ Threats</h4>
+            <ul>
+                <li><strong>Talent Exodus:</strong> Loss of institutional knowledge</li>
+                <li><strong>Market Competition:</strong> Traditional retailers adapting</li>
+                <li><strong>Economic Downturns:</strong> Culture investment sustainability</li>
+                <li><strong>Regulatory Changes:</strong> Labor law implications</li>
+                <li><strong>Leadership Transition:</strong> Post-founder syndrome</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Leadership Lessons
+    st.subheader("Key Leadership Lessons & Takeaways")
+
+    fig_lessons = cached_figure(__name__, build_lessons)
+    plotly_chart(fig_lessons, width="stretch")
+
+    # Future Implications
+    st.subheader("Future Implications for Leadership")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="insight-box">
+            <h4>🔮 Future of Organizational Design</h4>
+            <p><strong>Hybrid Models:</strong> Future organizations will likely combine traditional hierarchy
+            with self-management elements, learning from both Zappos' successes and failures.</p>
+
+            <p><strong>Technology Integration:</strong> AI and digital tools will enable better implementation
+            of distributed decision-making systems that Holacracy attempted manually.</p>
+
+            <p><strong>Cultural Measurement:</strong> Advanced analytics will provide better metrics for
+            cultural health and its impact on business performance.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="insight-box">
+            <h4>📈 Leadership Evolution Trends</h4>
+            <p><strong>Purpose-Driven Leadership:</strong> Hsieh's focus on happiness and purpose
+            foreshadowed the modern emphasis on meaningful work and social impact.</p>
+
+            <p><strong>Employee Experience:</strong> The investment in employee satisfaction is now
+            recognized as essential for talent retention and business success.</p>
+
+            <p><strong>Agile Organizations:</strong> The need for rapid adaptation that drove Holacracy
+            is now mainstream in digital transformation efforts.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Recommendations
+    st.subheader("Strategic Recommendations for Modern Leaders")
+
+    fig_recommendations = cached_figure(__name__, build_recommendations)
+    plotly_chart(fig_recommendations, width="stretch")
+
+    # Final insights
+    st.subheader("Critical Success Factors for Implementation")
+
+    st.markdown("""
+    <div class="leadership-principle">
+        <h4>🎯 The Zappos Formula for Success</h4>
+        <ol>
+            <li><strong>Start with Purpose:</strong> Define clear organizational mission beyond profit</li>
+            <li><strong>Hire for Culture:</strong> Prioritize values alignment in recruitment</li>
+            <li><strong>Empower Gradually:</strong> Build autonomy incrementally rather than revolutionary change</li>
+            <li><strong>Measure Culture:</strong> Develop metrics to track cultural health and business impact</li>
+            <li><strong>Lead by Example:</strong> Demonstrate authentic commitment to stated values</li>
+            <li><strong>Plan for Succession:</strong> Build leadership pipeline to sustain cultural transformation</li>
+        </ol>
+    </div>
+    """, unsafe_allow_html=True)
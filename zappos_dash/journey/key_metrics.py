@@ -0,0 +1,100 @@
+"""Key Metrics page of the Zappos journey dashboard."""
+import streamlit as st
+import plotly.express as px
+
+from zappos_dash import vega
+from zappos_dash.benchmarking import METHODS, benchmark_scores
+from zappos_dash.data import load_dataset, load_journey_data, select_years
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import altair_chart, plotly_chart
+
+
+def build_benchmark(method='range'):
+    # Normalized per metric across competitors (0-100 scale)
+    benchmark_normalized = benchmark_scores('journey/benchmarks', method).reset_index()
+
+    fig_benchmark = px.bar(benchmark_normalized, x='Metric',
+                          y=list(benchmark_normalized.columns[1:]),
+                          title='Performance Benchmarking (Normalized Scale)',
+                          barmode='group',
+                          labels={'value': METHODS[method], 'variable': 'Benchmark'})
+    return fig_benchmark
+
+
+def build_benchmark_vega(method='range'):
+    benchmark_long = benchmark_scores('journey/benchmarks', method).reset_index().melt(
+        id_vars='Metric', var_name='Benchmark', value_name='Score')
+    return vega.grouped_bar_chart(benchmark_long, x='Metric', y='Score', color='Benchmark',
+                                  title='Performance Benchmarking (Normalized Scale)',
+                                  y_title=METHODS[method])
+
+
+def build_roi():
+    roi_data = load_dataset('journey/roi')
+
+    fig_roi = px.scatter(roi_data, x='Investment_Million', y='ROI_Percentage',
+                        size='Payback_Years', color='Investment_Area',
+                        title='Investment ROI vs Payback Period',
+                        labels={'Investment_Million': 'Investment ($ Millions)',
+                               'ROI_Percentage': 'ROI (%)'})
+    return fig_roi
+
+
+def format_millions(value):
+    return f"${value / 1000:.1f}B" if value >= 1000 else f"${value:,.1f}M"
+
+
+def render(year_range=None):
+    st.header("📊 Key Performance Indicators")
+
+    # Revenue KPIs follow the selected year range
+    revenue_data = select_years(load_journey_data()[0], year_range)
+
+    # KPI Dashboard
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.subheader("Financial KPIs")
+        if len(revenue_data):
+            peak = revenue_data['Revenue_Million'].max()
+            growth = (peak / revenue_data['Revenue_Million'].iloc[0] - 1) * 100
+            per_employee = revenue_data['Revenue_Per_Employee'].iloc[-1]
+            st.metric("Peak Revenue", format_millions(peak), f"{float(f'{growth:.2g}'):,.0f}% growth")
+            st.metric("Revenue/Employee", f"${per_employee / 1e6:.2f}M", "Above industry avg")
+        else:
+            st.metric("Peak Revenue", "n/a", "No revenue data in range", delta_color="off")
+            st.metric("Revenue/Employee", "n/a")
+        st.metric("Growth Rate (1999-2015)", "26.3%", "CAGR")
+        st.metric("Amazon Acquisition", "$1.2B", "2009")
+
+    with col2:
+        st.subheader("Operational KPIs")
+        st.metric("Customer Satisfaction", "98%", "Industry leading")
+        st.metric("Return Policy", "365 days", "vs 30 days industry")
+        st.metric("Call Resolution Time", "Unlimited", "No time limits")
+        st.metric("Employee Retention", "82%", "During Holacracy")
+
+    with col3:
+        st.subheader("Cultural KPIs")
+        st.metric("Culture Fit Success", "97%", "Via 'The Offer'")
+        st.metric("Employee Engagement", "8.5/10", "Pre-Holacracy")
+        st.metric("Best Places to Work", "Top 10", "Multiple years")
+        st.metric("Culture Book Participation", "100%", "Voluntary")
+
+    # Comparative analysis
+    st.subheader("Industry Benchmarking")
+
+    method = st.radio("Benchmark scale", list(METHODS), format_func=METHODS.get,
+                      horizontal=True)
+    if vega.enabled():
+        chart_benchmark = cached_figure(__name__, build_benchmark_vega, method=method)
+        altair_chart(chart_benchmark, width="stretch")
+    else:
+        fig_benchmark = cached_figure(__name__, build_benchmark, method=method)
+        plotly_chart(fig_benchmark, width="stretch")
+
+    # ROI Analysis
+    st.subheader("Investment ROI Analysis")
+
+    fig_roi = cached_figure(__name__, build_roi)
+    plotly_chart(fig_roi, width="stretch")
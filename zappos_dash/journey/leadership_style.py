@@ -0,0 +1,49 @@
+"""Leadership Style page of the Zappos journey dashboard."""
+import streamlit as st
+import plotly.express as px
+
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import plotly_chart
+
+
+def build_leadership():
+    leadership_scores = load_dataset('journey/leadership_scores')
+
+    # Leadership comparison chart
+    fig_leadership = px.bar(leadership_scores, x='Dimension', y=['Score', 'Industry_Average'],
+                          title='Tony Hsieh Leadership Dimensions vs Industry Average',
+                          barmode='group')
+    fig_leadership.update_layout(height=500, xaxis_tickangle=-45)
+    return fig_leadership
+
+
+def build_evolution():
+    timeline_data = load_dataset('journey/leadership_timeline')
+
+    fig_evolution = px.line(timeline_data, x='Year', y='Leadership_Maturity',
+                          title='Leadership Maturity Evolution',
+                          markers=True, text='Phase')
+    fig_evolution.update_traces(textposition="top center")
+    return fig_evolution
+
+
+def render():
+    st.header("🎯 Tony Hsieh's Leadership Style Analysis")
+
+    # Leadership assessment
+    fig_leadership = cached_figure(__name__, build_leadership)
+    plotly_chart(fig_leadership, width="stretch")
+
+    # Leadership paradoxes
+    st.subheader("Leadership Paradoxes & Contradictions")
+
+    paradoxes = load_dataset('journey/paradoxes')
+
+    st.dataframe(paradoxes, width="stretch")
+
+    # Leadership evolution
+    st.subheader("Leadership Evolution Timeline")
+
+    fig_evolution = cached_figure(__name__, build_evolution)
+    plotly_chart(fig_evolution, width="stretch")
@@ -0,0 +1,13 @@
+"""Pages of the Tony Hsieh leadership dashboard (``final dashboard.py``)."""
+
+# Sidebar label -> page module; modules are imported only when selected
+PAGES = {
+    "🏠 Overview": "zappos_dash.leadership.overview",
+    "📊 Leadership Analysis": "zappos_dash.leadership.leadership_analysis",
+    "🏢 Zappos Journey": "zappos_dash.leadership.zappos_journey",
+    "⚡ Holacracy Experiment": "zappos_dash.leadership.holacracy_experiment",
+    "📈 Business Metrics": "zappos_dash.leadership.business_metrics",
+    "🎭 Culture & Values": "zappos_dash.leadership.culture_values",
+    "🎯 Leadership Principles": "zappos_dash.leadership.leadership_principles",
+    "🔍 Interpretation & Insights": "zappos_dash.leadership.interpretation_insights",
+}
@@ -0,0 +1,110 @@
+"""Business Metrics page of the leadership dashboard."""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from zappos_dash.data import load_dataset
+from zappos_dash.progressive import ChartSlots
+
+
+def build_financial():
+    financial_data = load_dataset('leadership/financials')
+    fig_financial = make_subplots(specs=[[{"secondary_y": True}]])
+
+    fig_financial.add_trace(
+        go.Scatter(x=financial_data['Year'], y=financial_data['Revenue'],
+                  mode='lines+markers', name='Revenue ($M)', line=dict(color='blue')),
+        secondary_y=False,
+    )
+
+    fig_financial.add_trace(
+        go.Scatter(x=financial_data['Year'], y=financial_data['Profit_Margin'],
+                  mode='lines+markers', name='Profit Margin (%)', line=dict(color='red')),
+        secondary_y=True,
+    )
+
+    fig_financial.update_xaxes(title_text="Year")
+    fig_financial.update_yaxes(title_text="Revenue ($ Millions)", secondary_y=False)
+    fig_financial.update_yaxes(title_text="Profit Margin (%)", secondary_y=True)
+    fig_financial.update_layout(title_text="Zappos Financial Performance")
+    return fig_financial
+
+
+def build_customers():
+    financial_data = load_dataset('leadership/financials')
+    fig_customers = px.line(financial_data, x='Year', y='Customer_Base',
+                          title="Customer Base Growth", markers=True)
+    fig_customers.update_layout(yaxis_title="Number of Customers")
+    return fig_customers
+
+
+def build_satisfaction():
+    satisfaction_data = load_dataset('leadership/customer_satisfaction')
+
+    fig_satisfaction = px.bar(satisfaction_data, x='Metric', y='Score',
+                            title="Customer Satisfaction Metrics")
+    fig_satisfaction.update_xaxes(tickangle=45)
+    return fig_satisfaction
+
+
+def build_competitive():
+    competitive_data = load_dataset('leadership/competitors')
+
+    fig_competitive = px.scatter(competitive_data, x='Customer_Satisfaction', y='Employee_Satisfaction',
+                               size='Innovation_Score', hover_name='Company', color='Culture_Rating',
+                               title="Competitive Positioning: Customer vs Employee Satisfaction")
+    fig_competitive.update_layout(
+        xaxis_title="Customer Satisfaction Score",
+        yaxis_title="Employee Satisfaction Score"
+    )
+    return fig_competitive
+
+
+def render():
+    st.markdown('<h2 class="section-header">Zappos Business Performance</h2>', unsafe_allow_html=True)
+
+    # Charts are built concurrently and fill in as each one is ready
+    charts = ChartSlots(__name__)
+
+    # Revenue and profitability
+    charts.chart(build_financial, width="stretch")
+
+    # Customer metrics
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Customer growth
+        charts.chart(build_customers, width="stretch")
+
+    with col2:
+        # Customer satisfaction metrics
+        charts.chart(build_satisfaction, width="stretch")
+
+    # Competitive analysis
+    st.markdown('<h3 class="section-header">Competitive Analysis</h3>', unsafe_allow_html=True)
+
+    charts.chart(build_competitive, width="stretch")
+
+    # Key performance indicators
+    st.markdown('<h3 class="section-header">Key Performance Indicators</h3>', unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Revenue Growth Rate", "15-25%", "Annual average")
+        st.metric("Market Share", "12%", "Online footwear")
+
+    with col2:
+        st.metric("Customer Lifetime Value", "$3,500", "+40% vs industry")
+        st.metric("Average Order Value", "$85", "Above industry avg")
+
+    with col3:
+        st.metric("Return Processing Time", "24 hours", "Industry leading")
+        st.metric("Call Resolution Rate", "95%", "First call")
+
+    with col4:
+        st.metric("Employee Productivity", "125%", "vs industry benchmark")
+        st.metric("Culture Score", "4.2/5", "Employee rating")
+
+    charts.fill()
@@ -0,0 +1,112 @@
+"""Culture & Values page of the leadership dashboard."""
+import streamlit as st
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.lists import bullet_list
+from zappos_dash.profiling import plotly_chart
+
+
+def build_values():
+    core_values = load_dataset('leadership/core_values')
+
+    # Values importance rating
+    values_data = {
+        'Value': [v[:20] + "..." if len(v) > 20 else v for v in core_values['Value']],
+        'Employee_Rating': core_values['Employee_Rating'],
+        'Implementation_Score': core_values['Implementation_Score']
+    }
+
+    fig_values = go.Figure()
+    fig_values.add_trace(go.Bar(name='Employee Rating', x=values_data['Value'],
+                               y=values_data['Employee_Rating'], marker_color='lightcoral'))
+    fig_values.add_trace(go.Bar(name='Implementation Score', x=values_data['Value'],
+                               y=values_data['Implementation_Score'], marker_color='skyblue'))
+    fig_values.update_layout(
+        title='Core Values: Employee Rating vs Implementation',
+        xaxis_tickangle=-45,
+        barmode='group',
+        xaxis_title="Core Values",
+        yaxis_title="Score (1-10)"
+    )
+    return fig_values
+
+
+def build_offer():
+    offer_data = load_dataset('leadership/offer_program')
+
+    fig_offer = make_subplots(specs=[[{"secondary_y": True}]])
+
+    fig_offer.add_trace(
+        go.Bar(x=offer_data['Year'], y=offer_data['Offer_Amount'], name='Offer Amount ($)',
+               marker_color='gold'),
+        secondary_y=False,
+    )
+
+    fig_offer.add_trace(
+        go.Scatter(x=offer_data['Year'], y=offer_data['Acceptance_Rate'],
+                  mode='lines+markers', name='Acceptance Rate (%)', line=dict(color='red')),
+        secondary_y=True,
+    )
+
+    fig_offer.update_layout(title='"The Offer" Program Evolution')
+    fig_offer.update_yaxes(title_text="Offer Amount ($)", secondary_y=False)
+    fig_offer.update_yaxes(title_text="Acceptance Rate (%)", secondary_y=True)
+    return fig_offer
+
+
+def render():
+    st.markdown('<h2 class="section-header">Zappos Culture Revolution</h2>', unsafe_allow_html=True)
+
+    # 10 Core Values
+    st.markdown('<h3 class="section-header">The 10 Core Values</h3>', unsafe_allow_html=True)
+
+    fig_values = cached_figure(__name__, build_values)
+    plotly_chart(fig_values, width="stretch")
+
+    # Culture initiatives
+    st.markdown('<h3 class="section-header">Culture Initiatives</h3>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### 🎉 Fun & Engagement")
+        culture_initiatives = [
+            "Nap rooms and relaxation areas",
+            "Petting zoo and animal therapy",
+            "Karaoke and game rooms",
+            "Theme days (Bald & Blue Day)",
+            "Office parades and celebrations",
+            "Popcorn machine robot",
+            "Adult ball pit"
+        ]
+
+        bullet_list(culture_initiatives)
+
+    with col2:
+        st.markdown("### 📚 Learning & Development")
+        learning_initiatives = [
+            "4-week comprehensive onboarding",
+            "Culture Book publication",
+            "Peer coaching programs",
+            "Personal development budgets",
+            "Cross-functional training",
+            "Leadership development circles",
+            "Continuous feedback systems"
+        ]
+
+        bullet_list(learning_initiatives)
+
+    # The Offer program
+    st.markdown('<h3 class="section-header">"The Offer" Program</h3>', unsafe_allow_html=True)
+
+    fig_offer = cached_figure(__name__, build_offer)
+    plotly_chart(fig_offer, width="stretch")
+
+    st.markdown("""
+    **"The Offer"** was Hsieh's radical hiring filter: new employees were paid thousands of dollars
+    to quit after training if they didn't feel aligned with Zappos culture. This ensured only
+    truly committed culture-fit employees remained.
+    """)
@@ -0,0 +1,145 @@
+"""Holacracy Experiment page of the leadership dashboard."""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.lists import bullet_list
+from zappos_dash.profiling import plotly_chart
+
+
+def build_hierarchy():
+    hierarchy_data = load_dataset('leadership/org_hierarchy')
+
+    fig_hierarchy = px.funnel(hierarchy_data, x='Count', y='Level',
+                            title="Traditional Organizational Structure")
+    return fig_hierarchy
+
+
+def build_circles():
+    circles_data = load_dataset('leadership/holacracy_circles')
+
+    fig_circles = px.scatter(circles_data, x='Members', y='Autonomy_Level',
+                           size='Members', hover_name='Circle',
+                           title="Holacracy Circle Structure")
+    return fig_circles
+
+
+def build_implementation():
+    implementation_data = load_dataset('leadership/holacracy_rollout')
+
+    fig_implementation = make_subplots(specs=[[{"secondary_y": True}]])
+
+    fig_implementation.add_trace(
+        go.Scatter(x=implementation_data['Phase'], y=implementation_data['Employee_Satisfaction'],
+                  mode='lines+markers', name='Employee Satisfaction (%)', line=dict(color='blue')),
+        secondary_y=False,
+    )
+
+    fig_implementation.add_trace(
+        go.Scatter(x=implementation_data['Phase'], y=implementation_data['Productivity'],
+                  mode='lines+markers', name='Productivity (%)', line=dict(color='green')),
+        secondary_y=False,
+    )
+
+    fig_implementation.add_trace(
+        go.Scatter(x=implementation_data['Phase'], y=implementation_data['Turnover_Rate'],
+                  mode='lines+markers', name='Turnover Rate (%)', line=dict(color='red')),
+        secondary_y=True,
+    )
+
+    fig_implementation.update_yaxes(title_text="Satisfaction & Productivity (%)", secondary_y=False)
+    fig_implementation.update_yaxes(title_text="Turnover Rate (%)", secondary_y=True)
+    fig_implementation.update_layout(title='Holacracy Implementation Impact Over Time')
+    return fig_implementation
+
+
+def build_impact():
+    impact_data = load_dataset('leadership/holacracy_impact')
+
+    fig_impact = go.Figure()
+    fig_impact.add_trace(go.Bar(name='Before Holacracy', x=impact_data['Metric'],
+                               y=impact_data['Before_Holacracy'], marker_color='lightblue'))
+    fig_impact.add_trace(go.Bar(name='After Holacracy', x=impact_data['Metric'],
+                               y=impact_data['After_Holacracy'], marker_color='darkblue'))
+    fig_impact.update_layout(title='Holacracy Impact on Key Metrics', barmode='group')
+    return fig_impact
+
+
+def render():
+    st.markdown('<h2 class="section-header">The Holacracy Revolution</h2>', unsafe_allow_html=True)
+
+    st.markdown("""
+    In 2013, Tony Hsieh made one of the most radical organizational decisions in corporate history:
+    **eliminating all managers** and implementing Holacracy, a self-management system.
+    """)
+
+    # Before vs After comparison
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### 🏢 Traditional Hierarchy (Before)")
+        st.markdown("""
+        - Clear reporting structure
+        - Managers make decisions
+        - Job titles and descriptions
+        - Top-down communication
+        - Performance reviews by supervisors
+        """)
+
+        # Hierarchical visualization
+        fig_hierarchy = cached_figure(__name__, build_hierarchy)
+        plotly_chart(fig_hierarchy, width="stretch")
+
+    with col2:
+        st.markdown("### ⭕ Holacracy Circles (After)")
+        st.markdown("""
+        - Self-organizing circles
+        - Distributed decision-making
+        - Multiple roles per person
+        - Peer-to-peer communication
+        - Continuous feedback loops
+        """)
+
+        # Holacracy visualization
+        fig_circles = cached_figure(__name__, build_circles)
+        plotly_chart(fig_circles, width="stretch")
+
+    # Implementation timeline
+    st.markdown('<h3 class="section-header">Holacracy Implementation Timeline</h3>', unsafe_allow_html=True)
+
+    fig_implementation = cached_figure(__name__, build_implementation)
+    plotly_chart(fig_implementation, width="stretch")
+
+    # Impact analysis
+    st.markdown('<h3 class="section-header">Holacracy Impact Analysis</h3>', unsafe_allow_html=True)
+
+    fig_impact = cached_figure(__name__, build_impact)
+    plotly_chart(fig_impact, width="stretch")
+
+    # Pros and Cons
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### ✅ Holacracy Benefits")
+        benefits = [
+            "Faster decision-making in some areas",
+            "Increased employee autonomy",
+            "Enhanced innovation and experimentation",
+            "Reduced bureaucracy",
+            "Better adaptation to change"
+        ]
+        bullet_list(benefits)
+
+    with col2:
+        st.markdown("### ❌ Holacracy Challenges")
+        challenges = [
+            "18% employee turnover initially",
+            "Role confusion and ambiguity",
+            "Difficulty in performance evaluation",
+            "Coordination challenges",
+            "Not suitable for all personality types"
+        ]
+        bullet_list(challenges)
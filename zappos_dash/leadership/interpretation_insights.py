@@ -0,0 +1,104 @@
+"""Interpretation & Insights page of the leadership dashboard."""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.lists import bullet_list
+from zappos_dash.profiling import plotly_chart
+
+
+def build_matrix():
+    effectiveness_data = load_dataset('leadership/effectiveness')
+
+    # Effectiveness vs Difficulty scatter plot
+    fig_matrix = px.scatter(effectiveness_data, x='Difficulty_Level', y='Effectiveness_Score',
+                          size='Impact_on_Business', hover_name='Leadership_Area',
+                          title="Leadership Effectiveness vs Implementation Difficulty")
+    fig_matrix.update_layout(
+        xaxis_title="Implementation Difficulty (1-10)",
+        yaxis_title="Leadership Effectiveness (1-10)"
+    )
+    return fig_matrix
+
+
+def build_success():
+    success_factors = load_dataset('leadership/success_factors')
+
+    fig_success = go.Figure()
+    fig_success.add_trace(go.Bar(name='Importance', x=success_factors['Factor'],
+                                y=success_factors['Importance'], marker_color='lightgreen'))
+    fig_success.add_trace(go.Bar(name='Hsieh Performance', x=success_factors['Factor'],
+                                y=success_factors['Hsieh_Performance'], marker_color='darkgreen'))
+    fig_success.update_layout(
+        title='Critical Success Factors: Importance vs Hsieh Performance',
+        xaxis_tickangle=-45,
+        barmode='group',
+        xaxis_title="Success Factors",
+        yaxis_title="Score (1-10)"
+    )
+    return fig_success
+
+
+def render():
+    st.markdown('<h2 class="section-header">Leadership Analysis & Insights</h2>', unsafe_allow_html=True)
+
+    # Leadership effectiveness analysis
+    st.markdown('<h3 class="section-header">Leadership Effectiveness Matrix</h3>', unsafe_allow_html=True)
+
+    fig_matrix = cached_figure(__name__, build_matrix)
+    plotly_chart(fig_matrix, width="stretch")
+
+    # SWOT Analysis
+    st.markdown('<h3 class="section-header">SWOT Analysis of Hsieh\'s Leadership</h3>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### 💪 Strengths")
+        strengths = [
+            "Exceptional culture building capabilities",
+            "Customer-centric vision and execution",
+            "Employee empowerment and engagement",
+            "Innovation and experimentation mindset",
+            "Authentic and transparent leadership style"
+        ]
+        bullet_list(strengths, marker="✅")
+
+        st.markdown("### 🚀 Opportunities")
+        opportunities = [
+            "Global expansion of culture model",
+            "Technology integration in culture building",
+            "Leadership development programs",
+            "Industry thought leadership",
+            "Cultural consulting services"
+        ]
+        bullet_list(opportunities, marker="🔍")
+
+    with col2:
+        st.markdown("### ⚠️ Weaknesses")
+        weaknesses = [
+            "Over-reliance on cultural fit vs. skills",
+            "Holacracy implementation challenges",
+            "Scalability issues with radical approaches",
+            "High employee turnover during transitions",
+            "Potential for cultural exclusion"
+        ]
+        bullet_list(weaknesses, marker="❌")
+
+        st.markdown("### 🎯 Threats")
+        threats = [
+            "Market conditions affecting culture investments",
+            "Competitor adoption of similar strategies",
+            "Regulatory challenges to radical policies",
+            "Economic downturns impacting fun culture",
+            "Generational changes in work preferences"
+        ]
+        bullet_list(threats, marker="⚡")
+
+    # Key Success Factors
+    st.markdown('<h3 class="section-header">Critical Success Factors</h3>', unsafe_allow_html=True)
+
+    fig_success = cached_figure(__name__, build_success)
+    plotly_chart(fig_success, width="stretch")
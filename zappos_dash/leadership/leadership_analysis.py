@@ -0,0 +1,68 @@
+"""Leadership Analysis page of the leadership dashboard."""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.profiling import plotly_chart
+
+
+def build_radar():
+    leadership_traits = load_dataset('leadership/traits')
+    fig_radar = go.Figure()
+    fig_radar.add_trace(go.Scatterpolar(
+        r=leadership_traits['Score'],
+        theta=leadership_traits['Trait'],
+        fill='toself',
+        name='Tony Hsieh Leadership Profile'
+    ))
+    fig_radar.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 10]
+            )),
+        showlegend=True,
+        title="Leadership Traits Assessment"
+    )
+    return fig_radar
+
+
+def build_styles():
+    styles_data = load_dataset('leadership/styles')
+
+    fig_pie = px.pie(styles_data, values='Influence', names='Style',
+                    title="Leadership Style Composition")
+    return fig_pie
+
+
+def build_lessons():
+    lessons = load_dataset('leadership/lessons')
+
+    fig_lessons = px.bar(lessons, x='Lesson', y='Impact_Score',
+                        title="Effectiveness of Leadership Lessons",
+                        hover_data=['Implementation'])
+    return fig_lessons
+
+
+def render():
+    st.markdown('<h2 class="section-header">Leadership Style Analysis</h2>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Radar chart
+        fig_radar = cached_figure(__name__, build_radar)
+        plotly_chart(fig_radar, width="stretch")
+
+    with col2:
+        # Leadership styles breakdown
+        fig_pie = cached_figure(__name__, build_styles)
+        plotly_chart(fig_pie, width="stretch")
+
+    # Leadership lessons
+    st.markdown('<h3 class="section-header">Key Leadership Lessons</h3>', unsafe_allow_html=True)
+
+    fig_lessons = cached_figure(__name__, build_lessons)
+    plotly_chart(fig_lessons, width="stretch")
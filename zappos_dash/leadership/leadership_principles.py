@@ -0,0 +1,53 @@
+"""Leadership Principles page of the leadership dashboard."""
+import streamlit as st
+import plotly.graph_objects as go
+
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.lists import card_list, quote_box
+from zappos_dash.profiling import plotly_chart
+
+
+def build_evolution():
+    evolution_data = load_dataset('leadership/evolution')
+
+    fig_evolution = go.Figure()
+
+    for metric in ['Vision_Clarity', 'Employee_Satisfaction', 'Innovation_Index', 'Market_Impact']:
+        fig_evolution.add_trace(go.Scatter(
+            x=evolution_data['Year'],
+            y=evolution_data[metric],
+            mode='lines+markers',
+            name=metric.replace('_', ' '),
+            line=dict(width=3)
+        ))
+
+    fig_evolution.update_layout(
+        title="Leadership Effectiveness Evolution (2000-2020)",
+        xaxis_title="Year",
+        yaxis_title="Effectiveness Score (1-10)",
+        hovermode='x unified'
+    )
+    return fig_evolution
+
+
+def render():
+    st.markdown('<h2 class="section-header">Leadership Principles</h2>', unsafe_allow_html=True)
+
+    st.markdown("""
+    Tony Hsieh's leadership was guided by principles that prioritized vision, culture, and long-term impact
+    over short-term gains. These principles shaped Zappos into a culture-driven powerhouse.
+    """)
+
+    # Leadership principles
+    principles = load_dataset('leadership/principles')
+
+    card_list(zip(principles['Principle'], principles['Description']), 'leadership-principle')
+
+    quote_box("Chase the vision, not the money; the money will end up following you.")
+
+    # Leadership effectiveness over time
+    st.markdown('<h3 class="section-header">Leadership Evolution Timeline</h3>', unsafe_allow_html=True)
+
+    fig_evolution = cached_figure(__name__, build_evolution)
+    plotly_chart(fig_evolution, width="stretch")
@@ -0,0 +1,57 @@
+"""Overview page of the leadership dashboard."""
+import streamlit as st
+import plotly.express as px
+
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.lists import quote_box
+from zappos_dash.profiling import plotly_chart
+
+
+def build_timeline():
+    timeline_data = load_dataset('leadership/career_timeline')
+
+    fig_timeline = px.scatter(timeline_data, x='Year', y='Impact', size='Impact',
+                            hover_data=['Event'], title="Tony Hsieh's Career Milestones")
+    fig_timeline.update_traces(marker=dict(sizemode='diameter', sizeref=0.5))
+    return fig_timeline
+
+
+def render():
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown('<h2 class="section-header">About Tony Hsieh (1973-2020)</h2>', unsafe_allow_html=True)
+
+        st.markdown("""
+        **Tony Hsieh** was a visionary entrepreneur and CEO who revolutionized corporate culture and customer service
+        through his leadership at Zappos. Born to a Taiwanese American family, Hsieh graduated from Harvard with a
+        computer science degree and went on to build multiple successful companies.
+
+        ### Key Achievements:
+        - 🚀 **Link Exchange**: Co-founded and sold to Microsoft for $265M (1998)
+        - 👟 **Zappos**: Transformed from struggling startup to $1B+ revenue company
+        - 📚 **Author**: "Delivering Happiness" became a business bestseller
+        - 🏙️ **Downtown Project**: Invested $350M to revitalize Las Vegas downtown
+        """)
+
+        # Timeline
+        st.markdown('<h3 class="section-header">Career Timeline</h3>', unsafe_allow_html=True)
+
+        fig_timeline = cached_figure(__name__, build_timeline)
+        plotly_chart(fig_timeline, width="stretch")
+
+    with col2:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Net Worth at Peak", "$840M", "+2000%")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Zappos Revenue (2008)", "$1B", "+62400%")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Years as Zappos CEO", "21", "1999-2020")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        quote_box("Our goal is to build a company where culture is the number one priority.")
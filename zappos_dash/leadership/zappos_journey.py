@@ -0,0 +1,89 @@
+"""Zappos Journey page of the leadership dashboard."""
+import streamlit as st
+import plotly.graph_objects as go
+
+from zappos_dash.charts import employees_area, revenue_line
+from zappos_dash.data import load_dataset
+from zappos_dash.figure_cache import cached_figure
+from zappos_dash.lists import details_list
+from zappos_dash.profiling import plotly_chart
+
+
+def build_revenue():
+    revenue_data = load_dataset('leadership/revenue')
+    fig_revenue = revenue_line(revenue_data, title="Zappos Revenue Growth Under Hsieh",
+                               markers=True)
+    fig_revenue.update_layout(yaxis_title="Revenue ($ Millions)")
+    return fig_revenue
+
+
+def build_employees():
+    revenue_data = load_dataset('leadership/revenue')
+    fig_employees = employees_area(revenue_data, title="Employee Growth at Zappos")
+    return fig_employees
+
+
+def build_phases():
+    phases_data = load_dataset('leadership/transformation_phases')
+
+    fig_phases = go.Figure()
+
+    x = phases_data['Phase']
+
+    fig_phases.add_trace(go.Bar(name='Revenue Growth %', x=x, y=phases_data['Revenue_Growth']))
+    fig_phases.add_trace(go.Bar(name='Culture Focus %', x=x, y=phases_data['Culture_Focus']))
+    fig_phases.add_trace(go.Bar(name='Innovation Level %', x=x, y=phases_data['Innovation_Level']))
+    fig_phases.add_trace(go.Bar(name='Risk Level %', x=x, y=phases_data['Risk_Level']))
+
+    fig_phases.update_layout(
+        title='Zappos Transformation Phases Analysis',
+        barmode='group',
+        xaxis_title='Business Phase',
+        yaxis_title='Intensity (%)'
+    )
+    return fig_phases
+
+
+def render():
+    st.markdown('<h2 class="section-header">The Zappos Transformation</h2>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Revenue growth
+        fig_revenue = cached_figure(__name__, build_revenue)
+        plotly_chart(fig_revenue, width="stretch")
+
+    with col2:
+        # Employee growth
+        fig_employees = cached_figure(__name__, build_employees)
+        plotly_chart(fig_employees, width="stretch")
+
+    # Transformation phases
+    st.markdown('<h3 class="section-header">Transformation Phases</h3>', unsafe_allow_html=True)
+
+    fig_phases = cached_figure(__name__, build_phases)
+    plotly_chart(fig_phases, width="stretch")
+
+    # Key milestones
+    st.markdown('<h3 class="section-header">Major Milestones</h3>', unsafe_allow_html=True)
+
+    milestones = load_dataset('leadership/milestones')
+
+    details_list(((f"📅 {year}: {event}", impact) for year, event, impact
+                  in zip(milestones['Year'], milestones['Event'], milestones['Impact'])),
+                 label="Impact:")
+
+    # Success metrics
+    st.markdown('<h3 class="section-header">Success Metrics</h3>', unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Peak Revenue", "$2.2B", "+137,400% from 2000")
+    with col2:
+        st.metric("Customer Retention", "90%+", "Industry leading")
+    with col3:
+        st.metric("Employee Satisfaction", "85%", "Above industry average")
+    with col4:
+        st.metric("Return Policy", "365 days", "Industry revolutionary")
@@ -0,0 +1,51 @@
+"""Lists and boxed quotes rendered as a single page element.
+
+Every ``st.markdown``/``st.write`` call is its own delta message and its
+own block in the page layout, so a loop emitting one call per item costs
+one message per item. These helpers join the whole list into one markdown
+string instead: a list of any length is one element.
+"""
+from html import escape
+
+import streamlit as st
+
+
+def bullet_list(items, marker="•"):
+    """One paragraph per item, each prefixed with ``marker``.
+
+    Items are markdown, as they would be for ``st.write``.
+    """
+    st.markdown("\n\n".join(f"{marker} {item}" for item in items))
+
+
+def card_list(items, css_class):
+    """One ``<div class=css_class>`` per ``(title, text)`` item."""
+    st.markdown("".join(
+        f'<div class="{css_class}"><strong>{escape(str(title))}</strong>: '
+        f'{escape(str(text))}</div>'
+        for title, text in items), unsafe_allow_html=True)
+
+
+def details_list(items, label=None, css_class="details-list"):
+    """A collapsible ``<details>`` block per ``(summary, text)`` item.
+
+    Stands in for a column of ``st.expander`` calls; the browser opens and
+    closes the blocks without a rerun. ``label`` is put in bold before
+    each text.
+    """
+    prefix = f"<strong>{escape(label)}</strong> " if label else ""
+    st.markdown(f'<div class="{css_class}">' + "".join(
+        f'<details><summary>{escape(str(summary))}</summary>'
+        f'<p>{prefix}{escape(str(text))}</p></details>'
+        for summary, text in items) + '</div>', unsafe_allow_html=True)
+
+
+def quote_box(quote, css_class="quote-box"):
+    """``quote`` in bold inside one ``<div class=css_class>``.
+
+    Opening and closing the div in separate ``st.markdown`` calls leaves
+    it empty: each call is sanitized on its own, so the div never wraps
+    the quote.
+    """
+    st.markdown(f'<div class="{css_class}">💭 <strong>"{escape(quote)}"</strong></div>',
+                unsafe_allow_html=True)
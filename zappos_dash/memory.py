@@ -0,0 +1,101 @@
+"""Memory accounting for operators of a shared dashboard server.
+
+Datasets are loaded once per process and handed to every session by
+reference, so they are reported once as shared memory. Figures live in
+the process-wide figure cache, which attributes them to the sessions
+using them. Set ``ZAPPOS_MEMORY_PANEL=1`` or open the app with
+``?memory=1`` to show the report in the sidebar; it is also logged as one
+JSON line per rerun.
+"""
+import json
+
+import pandas as pd
+import streamlit as st
+from streamlit.logger import get_logger
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from zappos_dash.data import SOURCES
+from zappos_dash import warmup
+from zappos_dash.figure_cache import get_figure_cache
+from zappos_dash.toggles import opt_in
+
+logger = get_logger(__name__)
+
+MB = 2**20
+
+
+def enabled():
+    return opt_in("ZAPPOS_MEMORY_PANEL", "memory")
+
+
+def shared_datasets():
+    """Rows of ``(dataset, rows, bytes)`` for every dataset loaded so far."""
+    rows = []
+    for name, source in SOURCES.items():
+        frame = source.loaded_frame()
+        if frame is not None:
+            rows.append((name, len(frame), int(frame.memory_usage(deep=True).sum())))
+    return rows
+
+
+def session_usage():
+    """``{session id: (figures, bytes)}`` for sessions that are still connected."""
+    cache = get_figure_cache()
+    cache.prune_sessions()
+    return cache.session_usage()
+
+
+def usage_report():
+    cache = get_figure_cache()
+    datasets = shared_datasets()
+    warm = warmup.current()
+    return {
+        "warmup": warm.report() if warm is not None else None,
+        "shared_dataset_bytes": sum(nbytes for _, _, nbytes in datasets),
+        "datasets_loaded": len(datasets),
+        "figure_cache_bytes": cache.nbytes,
+        "figures_cached": len(cache),
+        "session_limit_bytes": cache.session_limit,
+        "sessions": {session: {"figures": figures, "bytes": nbytes}
+                     for session, (figures, nbytes) in session_usage().items()},
+    }
+
+
+def warmup_status(report):
+    if report is None:
+        return "Warm-up: off"
+    if report["running"]:
+        return (f"Warm-up: running, {report['pages_done']}/{report['pages_total']} pages "
+                f"after {report['seconds']:.1f} s")
+    return (f"Warm-up: {report['figures']} figures of {report['pages_total']} pages "
+            f"in {report['seconds']:.1f} s")
+
+
+def show_memory_panel():
+    """Sidebar report of shared data, cached figures and per-session usage."""
+    report = usage_report()
+    logger.info(json.dumps({"event": "memory_usage", **report}))
+
+    ctx = get_script_run_ctx()
+    current = ctx.session_id if ctx is not None else None
+    sessions = pd.DataFrame(
+        [(session[:8] + (" (you)" if session == current else ""), usage["figures"],
+          usage["bytes"] / MB)
+         for session, usage in report["sessions"].items()],
+        columns=["Session", "Figures", "MB"])
+    datasets = pd.DataFrame(shared_datasets(), columns=["Dataset", "Rows", "Bytes"])
+    datasets["MB"] = datasets.pop("Bytes") / MB
+
+    with st.sidebar.expander("🧮 Memory", expanded=True):
+        st.caption(
+            f"Shared datasets: {report['shared_dataset_bytes'] / MB:.2f} MB "
+            f"({report['datasets_loaded']} loaded once for all sessions)  \n"
+            f"Figure cache: {report['figure_cache_bytes'] / MB:.2f} MB in "
+            f"{report['figures_cached']} figures  \n"
+            f"Per-session ceiling: {report['session_limit_bytes'] / MB:.0f} MB  \n"
+            + warmup_status(report["warmup"]))
+        st.dataframe(sessions, hide_index=True, width="stretch",
+                     column_config={"MB": st.column_config.NumberColumn(format="%.2f")})
+        st.dataframe(datasets.sort_values("MB", ascending=False), hide_index=True,
+                     width="stretch",
+                     column_config={"MB": st.column_config.NumberColumn(format="%.3f")})
@@ -0,0 +1,73 @@
+"""Lazy page dispatch for the dashboard scripts.
+
+Each dashboard registers its pages as ``{sidebar label: module path}``.
+Only the module of the selected page is imported, so a session pays the
+import and run cost (plotly, numpy, ...) of the page it is viewing alone.
+A dashboard script runs inside :func:`script_run`, which scopes the
+per-rerun bookkeeping to the whole script.
+"""
+import functools
+import importlib
+from contextlib import contextmanager
+
+import streamlit as st
+
+from zappos_dash import memory, payload, warmup
+from zappos_dash.profiling import profile_page, section, show_profile
+from zappos_dash.sources import stat_scope
+from zappos_dash.theme import apply_theme
+
+
+@contextmanager
+def script_run(dashboard=None):
+    """Scope of one run of a dashboard script (or of ``app.py``).
+
+    Data files are looked up once for the run and, when metering is on,
+    every message of the run is metered, the payload panel being drawn
+    at the end. ``dashboard`` names the theme to apply first. Runs nested
+    in another one, like a dashboard page of ``app.py``, share its scope.
+    """
+    with stat_scope(), payload.meter_run() as meter:
+        if dashboard is not None:
+            apply_theme(dashboard)
+        yield
+    if meter is not None:
+        payload.show_payload(meter)
+
+
+def fragment(func):
+    """``st.fragment`` whose reruns get the scope of a script run.
+
+    Outside a full rerun the payload of the fragment is metered and logged
+    on its own; fragments cannot draw in the sidebar, so no panel.
+    """
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        with stat_scope(), payload.meter_run(fragment=func.__qualname__):
+            return func(*args, **kwargs)
+
+    return st.fragment(run)
+
+
+def select_page(pages, label, title="🎯 Navigation"):
+    """Sidebar selectbox over the labels of ``pages``; returns the chosen one."""
+    st.sidebar.title(title)
+    return st.sidebar.selectbox(label, list(pages))
+
+
+def render_page(pages, page, **params):
+    """Import the module registered for ``page`` and run ``render(**params)``.
+
+    ``params`` carries sidebar filter values to the pages that take them.
+    """
+    # Warms the remaining pages in the background, once per process
+    warmup.start()
+    payload.set_page(page)
+    with stat_scope(), profile_page(page) as profile:
+        with section("import", pages[page]):
+            module = importlib.import_module(pages[page])
+        module.render(**params)
+    if profile is not None:
+        show_profile(profile)
+    if memory.enabled():
+        memory.show_memory_panel()
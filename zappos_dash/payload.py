@@ -0,0 +1,212 @@
+"""Opt-in metering of the bytes a page sends to the browser per rerun.
+
+Set ``ZAPPOS_PAYLOAD_METER=1`` or open the app with ``?payload=1`` to
+record the serialized size of every message a script run enqueues for
+the websocket: theme, header, sidebar controls, the page itself and the
+footer. The biggest elements are shown in a sidebar panel and each rerun
+is logged as one JSON line with its page, so logs can be grouped per
+page. Fragment reruns are logged on their own, marked with the fragment.
+A page whose payload exceeds its byte budget logs a warning;
+``ZAPPOS_PAYLOAD_BUDGET_KB`` sets the default budget and
+:data:`PAGE_BUDGETS` overrides it per page.
+"""
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+from streamlit.logger import get_logger
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from zappos_dash.toggles import opt_in
+
+logger = get_logger(__name__)
+
+KB = 1024
+DEFAULT_BUDGET = int(float(os.environ.get("ZAPPOS_PAYLOAD_BUDGET_KB", 512)) * KB)
+
+# Page label -> byte budget, for pages that need more or less than the default
+PAGE_BUDGETS = {}
+
+# Largest elements shown in the panel and the log line
+TOP_ELEMENTS = 10
+
+# Session state key of the page last rendered, for fragment reruns
+PAGE_KEY = "_zappos_payload_page"
+
+_state = threading.local()
+
+
+def enabled():
+    return opt_in("ZAPPOS_PAYLOAD_METER", "payload")
+
+
+def budget(page):
+    return PAGE_BUDGETS.get(page, DEFAULT_BUDGET)
+
+
+def describe(msg):
+    """``(kind, name)`` of a forward message: element type and, for charts, title."""
+    kind = msg.WhichOneof("type")
+    if kind != "delta":
+        return kind, ""
+    delta = msg.delta
+    kind = delta.WhichOneof("type")
+    if kind != "new_element":
+        return kind, ""
+    element = delta.new_element
+    kind = element.WhichOneof("type")
+    if kind == "plotly_chart" and element.plotly_chart.spec:
+        title = json.loads(element.plotly_chart.spec).get("layout", {}).get("title", {})
+        return kind, title.get("text", "") if isinstance(title, dict) else str(title)
+    return kind, ""
+
+
+class PayloadMeter:
+    """Serialized sizes of the messages sent during one script or fragment run."""
+
+    def __init__(self, page=None, fragment=None):
+        self.page = page
+        self.fragment = fragment
+        self.messages = []
+
+    @property
+    def budget(self):
+        return budget(self.page)
+
+    def record(self, msg):
+        # ``msg`` is what goes over the wire: a reference if the browser
+        # already caches it, the full message otherwise
+        kind, name = describe(msg)
+        self.messages.append((kind, name, msg.ByteSize()))
+
+    @property
+    def total(self):
+        return sum(nbytes for _, _, nbytes in self.messages)
+
+    @property
+    def over_budget(self):
+        return self.total > self.budget
+
+    def by_kind(self):
+        """``{kind: (messages, bytes)}``, biggest first."""
+        totals = {}
+        for kind, _, nbytes in self.messages:
+            count, size = totals.get(kind, (0, 0))
+            totals[kind] = (count + 1, size + nbytes)
+        return dict(sorted(totals.items(), key=lambda item: item[1][1], reverse=True))
+
+    def largest(self, n=TOP_ELEMENTS):
+        """The ``n`` biggest messages as ``(kind, name, bytes)``."""
+        return sorted(self.messages, key=lambda message: message[2], reverse=True)[:n]
+
+
+def _tap_enqueue(ctx, record):
+    """Call ``record(msg)`` for every message ``ctx`` enqueues; returns an undo function.
+
+    This is the only place that touches Streamlit internals: it wraps the
+    private ``ScriptRunContext._enqueue``. If a Streamlit upgrade removes
+    it, None is returned and metering is reported unavailable. A failure
+    while recording stops recording instead of breaking the page.
+    """
+    if not hasattr(ctx, "_enqueue"):
+        return None
+    enqueue = ctx._enqueue
+    broken = []
+
+    def metered_enqueue(msg):
+        if not broken:
+            try:
+                record(msg)
+            except Exception as error:
+                broken.append(error)
+                logger.warning("Payload metering stopped: %r", error)
+        enqueue(msg)
+
+    ctx._enqueue = metered_enqueue
+
+    def undo():
+        ctx._enqueue = enqueue
+
+    return undo
+
+
+def current():
+    """The meter of the script run in progress on this thread, or None."""
+    return getattr(_state, "meter", None)
+
+
+def set_page(page):
+    """Attribute the current run, and later reruns of its fragments, to ``page``."""
+    meter = current()
+    if meter is not None:
+        meter.page = page
+        st.session_state[PAGE_KEY] = page
+
+
+@contextmanager
+def meter_run(fragment=None):
+    """Meter every message enqueued in the block.
+
+    Yields the meter for the outermost block of a run, and None when
+    nested in another one, when metering is off or when it is
+    unavailable. ``fragment`` names the fragment for a fragment rerun.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is None or current() is not None or not enabled():
+        yield None
+        return
+
+    meter = PayloadMeter(st.session_state.get(PAGE_KEY) if fragment else None, fragment)
+    undo = _tap_enqueue(ctx, meter.record)
+    if undo is None:
+        logger.warning("Payload metering is unavailable with this Streamlit version")
+        yield None
+        return
+
+    _state.meter = meter
+    try:
+        yield meter
+    finally:
+        undo()
+        _state.meter = None
+        log_payload(meter)
+
+
+def log_payload(meter):
+    report = {
+        "event": "page_payload",
+        "page": meter.page,
+        "bytes": meter.total,
+        "messages": len(meter.messages),
+        "budget_bytes": meter.budget,
+        "by_kind": {kind: {"messages": count, "bytes": nbytes}
+                    for kind, (count, nbytes) in meter.by_kind().items()},
+        "largest": [{"kind": kind, "name": name, "bytes": nbytes}
+                    for kind, name, nbytes in meter.largest()],
+    }
+    if meter.fragment is not None:
+        report["fragment"] = meter.fragment
+    logger.info(json.dumps(report, ensure_ascii=False))
+    if meter.over_budget:
+        logger.warning("Page %r sent %d bytes, over its budget of %d bytes",
+                       meter.page, meter.total, meter.budget)
+
+
+def show_payload(meter):
+    """Sidebar table of the biggest elements sent by the run.
+
+    Drawn after ``meter`` stopped, so the panel is not counted itself.
+    """
+    table = pd.DataFrame(meter.largest(), columns=["Element", "Name", "Bytes"])
+    table["KB"] = table.pop("Bytes") / KB
+    with st.sidebar.expander(f"📦 Payload: {meter.total / KB:.1f} KB", expanded=True):
+        if meter.over_budget:
+            st.warning(f"Over the {meter.budget / KB:.0f} KB budget of this page")
+        st.caption(f"{len(meter.messages)} messages  \n" + "  \n".join(
+            f"{kind}: {nbytes / KB:.1f} KB in {count}"
+            for kind, (count, nbytes) in meter.by_kind().items()))
+        st.dataframe(table, hide_index=True, width="stretch",
+                     column_config={"KB": st.column_config.NumberColumn(format="%.1f")})
@@ -0,0 +1,173 @@
+"""Pre-baked Plotly specs for figures that depend on data alone.
+
+``python -m zappos_dash.prebake [--html]`` runs every page builder that
+takes no widget parameters and writes its Plotly JSON to ``PREBAKED_DIR``
+together with a manifest of the datasets (and their versions) each figure
+was built from, and a fingerprint of the code that built it. While both
+match, :func:`load_prebaked` serves the stored spec and the builder never
+runs; after a data or code change the affected figures fall back to
+building live until the specs are baked again.
+"""
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+from pathlib import Path
+
+import plotly
+import plotly.graph_objects as go
+import streamlit as st
+
+from zappos_dash.data import record_reads, source_versions, versions_current
+
+PREBAKED_DIR = Path(os.environ.get(
+    "ZAPPOS_PREBAKED_DIR", Path(__file__).resolve().parent.parent / "prebaked"))
+MANIFEST = "manifest.json"
+# Copied next to the HTML pages by ``include_plotlyjs="directory"``
+PLOTLY_JS = "plotly.min.js"
+
+
+def page_builders(module_name):
+    """Every ``build_*`` function defined in page module ``module_name``."""
+    module = importlib.import_module(module_name)
+    for name, build in inspect.getmembers(module, inspect.isfunction):
+        if name.startswith("build_") and build.__module__ == module_name:
+            yield build
+
+
+def static_builders():
+    """``(page module, builder)`` for every builder without parameters."""
+    from zappos_dash import acquisition, journey, leadership
+
+    for dashboard in (acquisition, leadership, journey):
+        for module_name in dashboard.PAGES.values():
+            for build in page_builders(module_name):
+                # Vega-Lite builders (``*_vega``) are left out: specs are
+                # restored as Plotly figures
+                if (not build.__name__.endswith("_vega")
+                        and not inspect.signature(build).parameters):
+                    yield module_name, build
+
+
+def spec_name(page, build):
+    return f"{page}.{build.__name__}"
+
+
+def code_files(page):
+    """Source files of page module ``page`` and of the package modules it uses."""
+    module = importlib.import_module(page)
+    files = {module.__file__}
+    for value in vars(module).values():
+        owner = inspect.getmodule(value)
+        if owner is not None and owner.__name__.startswith("zappos_dash."):
+            files.add(owner.__file__)
+    return sorted(files)
+
+
+def code_version(page):
+    """Fingerprint of the code behind the figures of ``page``, plotly included."""
+    digest = hashlib.sha256(plotly.__version__.encode())
+    for path in code_files(page):
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _read_manifest(directory, stamp):
+    # ``stamp`` (mtime, size) makes a re-bake visible without a restart
+    return json.loads((Path(directory) / MANIFEST).read_text(encoding="utf-8"))
+
+
+def read_manifest(directory=PREBAKED_DIR):
+    try:
+        stat = (Path(directory) / MANIFEST).stat()
+    except FileNotFoundError:
+        return {}
+    return _read_manifest(str(directory), (stat.st_mtime_ns, stat.st_size))
+
+
+def load_prebaked(page, build, directory=PREBAKED_DIR):
+    """``(figure, versions)`` pre-baked for ``build`` on ``page``, or None.
+
+    None when the figure was not baked, or one of its datasets or the
+    code that built it changed since. ``versions`` are the
+    ``(dataset, version)`` pairs it was built from.
+    """
+    entry = read_manifest(directory).get("figures", {}).get(spec_name(page, build))
+    # Manifests baked before per-figure versions map names to bare filenames
+    if not isinstance(entry, dict) or entry.get("code") != code_version(page):
+        return None
+    versions = tuple(tuple(pair) for pair in entry["sources"])
+    if not versions_current(versions):
+        return None
+    spec = json.loads((Path(directory) / entry["file"]).read_text(encoding="utf-8"))
+    # The spec was produced by plotly itself, so skip re-validating it
+    return go.Figure(spec, _validate=False), versions
+
+
+def baked_files(manifest):
+    """Names of the files written by the bake that produced ``manifest``."""
+    yield from manifest.get("assets", ())
+    for name, entry in manifest.get("figures", {}).items():
+        if isinstance(entry, dict):
+            yield entry["file"]
+            if "html" in entry:
+                yield entry["html"]
+        else:
+            # Manifests baked before per-figure versions: name -> JSON file
+            yield entry
+            yield f"{name}.html"
+
+
+def bake(directory=PREBAKED_DIR, html=False):
+    """Build every static figure into ``directory``; returns the manifest.
+
+    Specs of the previous bake that are not written again are removed;
+    no other file in ``directory`` is touched.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    try:
+        previous = json.loads((directory / MANIFEST).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        previous = {}
+
+    figures = {}
+    for page, build in static_builders():
+        name = spec_name(page, build)
+        with record_reads() as names:
+            fig = build()
+        (directory / f"{name}.json").write_text(fig.to_json(), encoding="utf-8")
+        figures[name] = {"file": f"{name}.json", "sources": source_versions(names),
+                         "code": code_version(page)}
+        if html:
+            # One shared plotly.min.js next to the pages keeps them usable offline
+            fig.write_html(directory / f"{name}.html", include_plotlyjs="directory")
+            figures[name]["html"] = f"{name}.html"
+
+    manifest = {"figures": figures, "assets": [PLOTLY_JS] if html else []}
+    (directory / MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    # Only once the new manifest is in place, so readers never miss a spec
+    for filename in set(baked_files(previous)) - set(baked_files(manifest)):
+        (directory / Path(filename).name).unlink(missing_ok=True)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-bake static dashboard figures to Plotly JSON.")
+    parser.add_argument("--output", default=PREBAKED_DIR, type=Path,
+                        help=f"output directory (default: {PREBAKED_DIR})")
+    parser.add_argument("--html", action="store_true",
+                        help="also write a standalone HTML page per figure")
+    args = parser.parse_args()
+
+    manifest = bake(args.output, html=args.html)
+    datasets = {name for entry in manifest["figures"].values() for name, _ in entry["sources"]}
+    print(f"Baked {len(manifest['figures'])} figures from {len(datasets)} datasets "
+          f"into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Opt-in per-section timing of page reruns.
+
+Set ``ZAPPOS_PROFILE=1`` or open the app with ``?profile=1`` to time every
+dataset load, figure build and chart render of the current page. The
+breakdown is shown in a sidebar panel and logged as one JSON line per
+rerun. When profiling is off, ``section()`` returns a shared no-op context
+manager, so instrumented code pays one thread-local lookup.
+"""
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+import pandas as pd
+import streamlit as st
+from streamlit.logger import get_logger
+
+from zappos_dash.toggles import opt_in
+
+logger = get_logger(__name__)
+
+_state = threading.local()
+_NULL = nullcontext()
+
+
+def enabled():
+    return opt_in("ZAPPOS_PROFILE", "profile")
+
+
+class Profile:
+    """Timings of the sections run while rendering one page."""
+
+    def __init__(self, page):
+        self.page = page
+        self.total = 0.0
+        self.sections = []
+        # Time spent in nested sections, one accumulator per open section
+        self._children = []
+
+    @contextmanager
+    def section(self, kind, name):
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            # Record self time so nested sections are not counted twice
+            self.sections.append((kind, name, elapsed - nested))
+
+    def summary(self):
+        """Rows of ``(kind, name, calls, ms)``, slowest first, plus the remainder."""
+        calls, seconds = defaultdict(int), defaultdict(float)
+        for kind, name, elapsed in self.sections:
+            calls[kind, name] += 1
+            seconds[kind, name] += elapsed
+        rows = [(kind, name, calls[kind, name], seconds[kind, name] * 1000)
+                for kind, name in sorted(seconds, key=seconds.get, reverse=True)]
+        rows.append(("other", "page code", 1, (self.total - sum(seconds.values())) * 1000))
+        return rows
+
+
+def section(kind, name):
+    """Time the enclosed block as ``name`` under ``kind`` (data, figure, render...)."""
+    profile = getattr(_state, "profile", None)
+    if profile is None:
+        return _NULL
+    return profile.section(kind, name)
+
+
+@contextmanager
+def profile_page(page):
+    """Collect the sections of one page render; yields None when profiling is off."""
+    if not enabled():
+        yield None
+        return
+
+    profile = Profile(page)
+    _state.profile = profile
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total = time.perf_counter() - start
+        _state.profile = None
+        logger.info(json.dumps({
+            "event": "page_profile",
+            "page": page,
+            "total_ms": round(profile.total * 1000, 3),
+            "sections": [{"kind": kind, "name": name, "calls": calls, "ms": round(ms, 3)}
+                         for kind, name, calls, ms in profile.summary()],
+        }, ensure_ascii=False))
+
+
+def show_profile(profile):
+    """Sidebar table with the section breakdown of ``profile``."""
+    rows = profile.summary()
+    table = pd.DataFrame(rows, columns=["Kind", "Section", "Calls", "ms"])
+    table["Share"] = 100 * table["ms"] / (profile.total * 1000)
+    with st.sidebar.expander(f"⏱️ Profile: {profile.total * 1000:.1f} ms", expanded=True):
+        st.dataframe(table, hide_index=True, width="stretch",
+                     column_config={
+                         "ms": st.column_config.NumberColumn(format="%.2f"),
+                         "Share": st.column_config.ProgressColumn(min_value=0, max_value=100,
+                                                                  format="%.0f%%"),
+                     })
+
+
+def _chart_width(kwargs):
+    # ``use_container_width`` is deprecated in favour of ``width``
+    if "use_container_width" in kwargs:
+        kwargs.setdefault("width", "stretch" if kwargs.pop("use_container_width") else "content")
+    return kwargs
+
+
+def plotly_chart(fig, **kwargs):
+    """``st.plotly_chart`` timed as a render section, named after the figure title."""
+    kwargs = _chart_width(kwargs)
+    if getattr(_state, "profile", None) is None:
+        return st.plotly_chart(fig, **kwargs)
+    with section("render", fig.layout.title.text or "plotly_chart"):
+        return st.plotly_chart(fig, **kwargs)
+
+
+def altair_chart(chart, **kwargs):
+    """``st.altair_chart`` timed as a render section, named after the chart title."""
+    kwargs = _chart_width(kwargs)
+    if getattr(_state, "profile", None) is None:
+        return st.altair_chart(chart, **kwargs)
+    with section("render", chart.title if isinstance(chart.title, str) else "altair_chart"):
+        return st.altair_chart(chart, **kwargs)
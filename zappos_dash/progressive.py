@@ -0,0 +1,62 @@
+"""Concurrent figure builds for pages with several charts.
+
+A page reserves a placeholder per chart with :meth:`ChartSlots.chart`,
+which also starts building that figure, and loading its datasets, on a
+shared thread pool. :meth:`ChartSlots.fill` then draws each chart as soon
+as its own figure is ready, so the text and metrics of the page appear
+straight away and no chart waits for a slower source. Workers only load
+data and build figures; every element is still drawn by the script
+thread. ``ZAPPOS_LOAD_WORKERS`` sets the pool size.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from zappos_dash.figure_cache import get_figure
+from zappos_dash.profiling import plotly_chart, section
+from zappos_dash.sources import current_stat_scope, stat_scope
+
+WORKERS = int(os.environ.get("ZAPPOS_LOAD_WORKERS", 8))
+
+
+@st.cache_resource(show_spinner=False)
+def get_executor():
+    return ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="zappos-build")
+
+
+class ChartSlots:
+    """Charts of one page render, built concurrently and drawn as they finish."""
+
+    def __init__(self, page):
+        self.page = page
+        ctx = get_script_run_ctx()
+        self.session = ctx.session_id if ctx is not None else None
+        # Workers reuse the file lookups of the render they build for
+        self._stats = current_stat_scope()
+        # Future -> (placeholder, draw function, its keyword arguments)
+        self._slots = {}
+
+    def chart(self, build, params=None, draw=plotly_chart, **kwargs):
+        """Reserve a placeholder here and start building ``build(**params)``.
+
+        Once built, the figure is drawn with ``draw(fig, **kwargs)``.
+        """
+        placeholder = st.empty()
+        placeholder.caption("⏳ Loading chart...")
+        future = get_executor().submit(self._build, build, params or {})
+        self._slots[future] = (placeholder, draw, kwargs)
+
+    def _build(self, build, params):
+        with stat_scope(self._stats):
+            return get_figure(self.page, build, params, self.session)
+
+    def fill(self):
+        """Draw every reserved chart, in the order their figures finish."""
+        # Builds run on other threads; the profile sees the time spent waiting
+        with section("figure", f"{len(self._slots)} concurrent builds"):
+            for future in as_completed(self._slots):
+                placeholder, draw, kwargs = self._slots.pop(future)
+                with placeholder:
+                    draw(future.result(), **kwargs)
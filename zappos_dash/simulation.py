@@ -0,0 +1,65 @@
+"""Monte Carlo mode of the M&A success score calculator.
+
+Each of the six factor ratings is treated as a normal distribution around
+its slider value, clipped to the 1-10 scale. All scenarios are drawn in
+one ``(scenarios, factors)`` NumPy batch and averaged per row into a
+success score, exactly as the calculator averages the sliders. Only the
+score histogram and band probabilities are kept, cached per slider
+configuration.
+"""
+import numpy as np
+import streamlit as st
+
+SCENARIOS = 250_000
+SCALE = (1, 10)
+
+# Lower bound of the score -> (recommendation, colour), best band first
+BANDS = [
+    (8, 'Highly Likely to Succeed ✅', 'green'),
+    (6, 'Moderate Success Potential ⚠️', 'orange'),
+    (-np.inf, 'High Risk of Failure ❌', 'red'),
+]
+
+# Histogram bins of 0.1 score points over the whole scale
+BIN_EDGES = np.linspace(SCALE[0], SCALE[1], 91)
+
+
+def recommend(score):
+    """``(recommendation, colour)`` of the band ``score`` falls in."""
+    for bound, recommendation, color in BANDS:
+        if score >= bound:
+            return recommendation, color
+
+
+def simulate_scores(ratings, spread, scenarios=SCENARIOS, seed=0):
+    """Success scores of ``scenarios`` draws around ``ratings``."""
+    rng = np.random.default_rng(seed)
+    draws = rng.normal(np.asarray(ratings, dtype=float), spread,
+                       size=(scenarios, len(ratings)))
+    np.clip(draws, *SCALE, out=draws)
+    return draws.mean(axis=1)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def simulate(ratings, spread, scenarios=SCENARIOS):
+    """Score distribution summary for one slider configuration.
+
+    ``ratings`` is a tuple of the six slider values. The result holds the
+    histogram ``counts`` over ``BIN_EDGES``, the probability of each band
+    (keyed by recommendation) and the mean and 5th/95th percentiles.
+    """
+    scores = simulate_scores(ratings, spread, scenarios)
+    counts, _ = np.histogram(scores, bins=BIN_EDGES)
+    probabilities = {}
+    upper = np.inf
+    for bound, recommendation, _ in BANDS:
+        probabilities[recommendation] = float(np.mean((scores >= bound) & (scores < upper)))
+        upper = bound
+    p5, p95 = np.percentile(scores, [5, 95])
+    return {
+        'counts': counts,
+        'probabilities': probabilities,
+        'mean': float(scores.mean()),
+        'p5': float(p5),
+        'p95': float(p95),
+    }
@@ -0,0 +1,167 @@
+"""File-backed data sources.
+
+A dataset named ``"<dashboard>/<name>"`` lives in ``DATA_DIR`` as
+``<dashboard>/<name>.parquet``, ``.sqlite`` (table ``<name>``) or ``.csv``,
+checked in that order, so a larger Parquet or SQLite export can replace
+a bundled CSV without code changes.
+
+Each source remembers the mtime and size of its file and re-hashes the
+content only when they change. Frames are cached per content hash, so
+touching a file costs one hash and editing it costs one reload; callers
+never re-read unchanged data. Inside :func:`stat_scope` (one per rerun)
+the file lookup of each source is made once and reused.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+DATA_DIR = Path(os.environ.get(
+    "ZAPPOS_DATA_DIR", Path(__file__).resolve().parent.parent / "data"))
+
+# Lookup order when several files exist for the same dataset
+SUFFIXES = (".parquet", ".sqlite", ".csv")
+
+
+_scope = threading.local()
+
+
+@contextmanager
+def stat_scope(memo=None):
+    """Reuse the file lookups made inside the block; yields the shared memo.
+
+    A rerun opens one scope, so each source is looked up (and its file
+    stat'ed) once per rerun however many figures check its version.
+    Nested scopes share the outer memo; pass ``memo`` to share one with
+    another thread.
+    """
+    outer = getattr(_scope, "memo", None)
+    if memo is None and outer is not None:
+        yield outer
+        return
+    _scope.memo = {} if memo is None else memo
+    try:
+        yield _scope.memo
+    finally:
+        _scope.memo = outer
+
+
+def current_stat_scope():
+    """The memo of the enclosing :func:`stat_scope`, or None outside one."""
+    return getattr(_scope, "memo", None)
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+class DataSource:
+    """One dataset backed by a CSV, Parquet or SQLite file."""
+
+    def __init__(self, name, parse_dates=None, sort_by=None, optional=False):
+        self.name = name
+        self.parse_dates = parse_dates
+        self.sort_by = sort_by
+        self.optional = optional
+        self._stamp = None
+        self._digest = None
+        self._lock = threading.Lock()
+        self._loaded = None
+
+    def __repr__(self):
+        return f"DataSource({self.name!r})"
+
+    def _find(self):
+        for suffix in SUFFIXES:
+            path = DATA_DIR / (self.name + suffix)
+            try:
+                return path, path.stat()
+            except FileNotFoundError:
+                continue
+        return None
+
+    def locate(self):
+        """``(path, stat)`` of the backing file, or None if there is none."""
+        memo = getattr(_scope, "memo", None)
+        if memo is None:
+            return self._find()
+        if self.name not in memo:
+            memo[self.name] = self._find()
+        return memo[self.name]
+
+    def exists(self):
+        return self.locate() is not None
+
+    @property
+    def path(self):
+        found = self.locate()
+        if found is None:
+            raise FileNotFoundError(
+                f"No data file for {self.name!r} in {DATA_DIR} "
+                f"(tried {', '.join(SUFFIXES)})")
+        return found[0]
+
+    def version(self):
+        """Content hash of the backing file.
+
+        The file is re-hashed only when its path, mtime or size differs
+        from the last call, so a version check is one lookup, and none
+        when the source was already looked up in the current
+        :func:`stat_scope`. An optional source without a file has the
+        version ``"missing"``.
+        """
+        found = self.locate()
+        if found is None and self.optional:
+            return "missing"
+        path = self.path
+        stat = found[1]
+        stamp = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if stamp != self._stamp:
+                self._digest = _hash_file(path)
+                self._stamp = stamp
+            return self._digest
+
+    def read(self):
+        """Read the backing file into a new DataFrame, bypassing caches."""
+        path = self.path
+        if path.suffix == ".parquet":
+            frame = pd.read_parquet(path)
+        elif path.suffix == ".sqlite":
+            table = self.name.rsplit("/", 1)[-1]
+            with sqlite3.connect(path) as conn:
+                frame = pd.read_sql_query(f'SELECT * FROM "{table}"', conn)
+        else:
+            frame = pd.read_csv(path)
+        for column in self.parse_dates or ():
+            frame[column] = pd.to_datetime(frame[column])
+        if self.sort_by is not None:
+            # Sorted once on load so range lookups can binary-search it
+            frame = frame.sort_values(self.sort_by, kind="stable", ignore_index=True)
+        return frame
+
+    def load(self):
+        """Return the shared frame for the file's current content."""
+        return _load_frame(self, self.name, self.version())
+
+    def loaded_frame(self):
+        """The shared frame most recently loaded, or None if not loaded yet."""
+        return self._loaded() if self._loaded is not None else None
+
+
+@st.cache_resource(show_spinner=False, max_entries=512)
+def _load_frame(_source, name, version):
+    # ``name`` and ``version`` form the cache key; ``_source`` is unhashed.
+    frame = _source.read()
+    _source._loaded = weakref.ref(frame)
+    return frame
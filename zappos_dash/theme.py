@@ -0,0 +1,83 @@
+"""Page configuration and CSS of the three dashboards.
+
+Every dashboard uses the same class names (``main-header``,
+``insight-box``, ...) with its own colours, so each theme is the shared
+``static/theme/base.css`` plus the dashboard's own stylesheet. With
+``server.enableStaticServing`` on (see ``.streamlit/config.toml``) the
+page only carries ``<link>`` tags to those files, versioned by content
+hash so the browser fetches each one once and again only after it
+changes. Without static serving the stylesheets are inlined.
+"""
+import hashlib
+from pathlib import Path
+
+import streamlit as st
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+THEME_DIR = STATIC_DIR / "theme"
+# URL of STATIC_DIR, relative to the app so it also works under a base path
+STATIC_URL = "app/static"
+
+# Dashboard -> page config; its stylesheet is THEME_DIR / f"{name}.css"
+THEMES = {
+    "acquisition": {
+        "page_title": "Amazon-Zappos Acquisition Analysis Dashboard",
+        "page_icon": "👟",
+    },
+    "leadership": {
+        "page_title": "Tony Hsieh Leadership Analysis",
+        "page_icon": "👔",
+    },
+    "journey": {
+        "page_title": "Tony Hsieh & Zappos Leadership Analysis",
+        "page_icon": "👟",
+    },
+}
+
+
+def stylesheets(name):
+    """Stylesheets of dashboard ``name``, base rules first."""
+    return [THEME_DIR / "base.css", THEME_DIR / f"{name}.css"]
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _read_stylesheet(path, stamp):
+    # ``stamp`` (mtime, size) picks up an edited stylesheet without a restart
+    css = Path(path).read_text(encoding="utf-8")
+    return css, hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+
+
+def read_stylesheet(path):
+    """``(css, version)`` of the stylesheet at ``path``."""
+    stat = path.stat()
+    return _read_stylesheet(str(path), (stat.st_mtime_ns, stat.st_size))
+
+
+def theme_css(name):
+    """The full stylesheet of dashboard ``name``: base rules, then overrides."""
+    return "".join(read_stylesheet(path)[0] for path in stylesheets(name))
+
+
+def theme_links(name):
+    """``<link>`` tags to the stylesheets of ``name``, cache-busted by version."""
+    links = []
+    for path in stylesheets(name):
+        _, version = read_stylesheet(path)
+        href = f"{STATIC_URL}/{path.relative_to(STATIC_DIR).as_posix()}?v={version}"
+        links.append(f'<link rel="stylesheet" href="{href}">')
+    return "".join(links)
+
+
+def apply_theme(name):
+    """Configure the page and attach the stylesheet of dashboard ``name``."""
+    theme = THEMES[name]
+    st.set_page_config(
+        page_title=theme["page_title"],
+        page_icon=theme["page_icon"],
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    if st.get_option("server.enableStaticServing"):
+        st.markdown(theme_links(name), unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>{theme_css(name)}</style>", unsafe_allow_html=True)
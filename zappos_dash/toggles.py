@@ -0,0 +1,11 @@
+"""Opt-in switches of the operator panels (profile, memory, payload)."""
+import os
+
+import streamlit as st
+
+
+def opt_in(env_var, query_param):
+    """Whether ``env_var`` is set to anything but ``0``, or the app was opened with ``?query_param=1``."""
+    if os.environ.get(env_var, "") not in ("", "0"):
+        return True
+    return st.query_params.get(query_param) == "1"
@@ -0,0 +1,58 @@
+"""Vega-Lite (Altair) renderer for selected charts.
+
+Set ``ZAPPOS_RENDERER=vega`` or open the app with ``?renderer=vega`` to
+draw the cultural metrics, benchmark bars and revenue series with
+Vega-Lite instead of Plotly. The pages group and filter their rows with
+pandas on the server (:func:`zappos_dash.charts.aggregate`) before either
+renderer sees them, so both draw the same numbers and a spec carries the
+aggregated rows only, with no Vega transforms; its size depends on the
+number of groups, not on the number of input rows.
+"""
+import os
+
+import altair as alt
+import streamlit as st
+
+RENDERERS = ("plotly", "vega")
+
+
+def renderer():
+    """The chart renderer picked for this session, ``plotly`` by default."""
+    choice = st.query_params.get("renderer") or os.environ.get("ZAPPOS_RENDERER", "plotly")
+    return choice if choice in RENDERERS else "plotly"
+
+
+def enabled():
+    return renderer() == "vega"
+
+
+def line_chart(long, x, y, color, title, colors=None, height=400, x_label_angle=0):
+    """Line-per-``color`` chart with point markers, from long-format rows."""
+    scale = alt.Scale(domain=list(colors), range=list(colors.values())) if colors else alt.Undefined
+    return alt.Chart(long, title=title, height=height).mark_line(point=True).encode(
+        x=alt.X(x, type="nominal", sort=None, axis=alt.Axis(labelAngle=x_label_angle)),
+        y=alt.Y(y, type="quantitative"),
+        color=alt.Color(color, type="nominal", sort=None, scale=scale),
+        tooltip=[x, color, y],
+    )
+
+
+def grouped_bar_chart(long, x, y, color, title, y_title=None, height=400):
+    """Side-by-side bars per ``x`` category, one per ``color`` value."""
+    return alt.Chart(long, title=title, height=height).mark_bar().encode(
+        x=alt.X(x, type="nominal", sort=None),
+        xOffset=alt.XOffset(color, type="nominal", sort=None),
+        y=alt.Y(y, type="quantitative", title=y_title or y),
+        color=alt.Color(color, type="nominal", sort=None),
+        tooltip=[x, color, y],
+    )
+
+
+def bar_chart(frame, x, y, title, y_title=None, scheme="blues", height=400):
+    """One bar per ``x`` value, coloured by its height."""
+    return alt.Chart(frame, title=title, height=height).mark_bar().encode(
+        x=alt.X(x, type="ordinal"),
+        y=alt.Y(y, type="quantitative", title=y_title or y),
+        color=alt.Color(y, type="quantitative", scale=alt.Scale(scheme=scheme)),
+        tooltip=[x, y],
+    )
@@ -0,0 +1,185 @@
+"""Background warm-up of the dataset and figure caches.
+
+Loads every registered dataset, then builds every figure of every page in
+the page selectbox of each dashboard, with the builders' default
+parameters (the widgets' initial values), so the first visitor after a
+deploy is served from warm caches. The warm-up runs on one daemon thread
+and logs a JSON line per page and a summary with its duration; the
+memory panel shows its progress.
+
+``ZAPPOS_WARMUP`` picks the dashboards to warm: unset or ``all`` for all
+of them, a comma-separated list such as ``acquisition,journey`` for
+some, ``0`` to turn it off. ``python -m zappos_dash.warmup run app.py
+[streamlit options]`` starts the warm-up together with the server;
+under a plain ``streamlit run`` it starts with the first session.
+``python -m zappos_dash.warmup`` warms in the foreground and exits,
+which is handy to time it.
+"""
+import importlib
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+
+from streamlit.logger import get_logger
+
+from zappos_dash.data import DERIVED, SOURCES, load_derived
+from zappos_dash.figure_cache import get_figure
+from zappos_dash.prebake import page_builders, spec_name
+from zappos_dash.sources import stat_scope
+
+logger = get_logger(__name__)
+
+DASHBOARDS = ("acquisition", "leadership", "journey")
+
+
+def selected_dashboards():
+    """Dashboards named by ``ZAPPOS_WARMUP``; empty when warm-up is off."""
+    setting = os.environ.get("ZAPPOS_WARMUP", "all").strip().lower()
+    if setting in ("0", "off", "false", "no"):
+        return ()
+    if setting in ("", "1", "all", "on", "true", "yes"):
+        return DASHBOARDS
+    return tuple(name for name in DASHBOARDS
+                 if name in {part.strip() for part in setting.split(",")})
+
+
+def default_params(build):
+    """The builder's defaults as explicit params, or None if one has no default."""
+    params = {}
+    for name, parameter in inspect.signature(build).parameters.items():
+        if parameter.default is inspect.Parameter.empty:
+            return None
+        params[name] = parameter.default
+    return params
+
+
+class WarmUp:
+    """Progress of one warm-up run over ``dashboards``."""
+
+    def __init__(self, dashboards):
+        self.dashboards = dashboards
+        self.pages_total = 0
+        self.pages_done = 0
+        self.datasets = 0
+        self.figures = 0
+        self.failed = []
+        self.started = None
+        self.seconds = None
+
+    def run(self):
+        self.started = time.perf_counter()
+        try:
+            self.warm_datasets()
+            pages = [(dashboard, label, module_name)
+                     for dashboard in self.dashboards
+                     for label, module_name in importlib.import_module(
+                         f"zappos_dash.{dashboard}").PAGES.items()]
+            self.pages_total = len(pages)
+            for dashboard, label, module_name in pages:
+                start = time.perf_counter()
+                with stat_scope():
+                    self.warm_page(module_name)
+                self.pages_done += 1
+                logger.info(json.dumps({
+                    "event": "warmup_progress",
+                    "dashboard": dashboard,
+                    "page": label,
+                    "done": self.pages_done,
+                    "total": self.pages_total,
+                    "ms": round((time.perf_counter() - start) * 1000, 3),
+                }, ensure_ascii=False))
+        finally:
+            self.seconds = time.perf_counter() - self.started
+            logger.info(json.dumps({"event": "warmup_done", **self.report()}))
+
+    def warm_datasets(self):
+        for name, source in SOURCES.items():
+            if source.exists():
+                if name in DERIVED:
+                    load_derived(name)
+                else:
+                    source.load()
+                self.datasets += 1
+
+    def warm_page(self, module_name):
+        for build in page_builders(module_name):
+            params = default_params(build)
+            if params is None:
+                continue
+            try:
+                get_figure(module_name, build, params)
+                self.figures += 1
+            except FileNotFoundError:
+                # Builders of optional datasets that are not deployed
+                pass
+            except Exception as error:
+                # One broken figure must not stop the others from warming
+                self.failed.append(spec_name(module_name, build))
+                logger.warning("Warm-up of %s failed: %r", spec_name(module_name, build), error)
+
+    def report(self):
+        if self.seconds is not None:
+            seconds = self.seconds
+        else:
+            seconds = time.perf_counter() - self.started if self.started is not None else 0.0
+        return {
+            "running": self.seconds is None,
+            "dashboards": list(self.dashboards),
+            "pages_done": self.pages_done,
+            "pages_total": self.pages_total,
+            "datasets": self.datasets,
+            "figures": self.figures,
+            "failed": self.failed,
+            "seconds": round(seconds, 3),
+        }
+
+
+# The warm-up of this process, once started
+_current = None
+_lock = threading.Lock()
+
+
+def start():
+    """Start the warm-up once per process; returns it, or None when it is off."""
+    global _current
+    dashboards = selected_dashboards()
+    if not dashboards:
+        return None
+    with _lock:
+        if _current is None:
+            _current = WarmUp(dashboards)
+            threading.Thread(target=_current.run, name="zappos-warmup", daemon=True).start()
+        return _current
+
+
+def current():
+    """The running or finished warm-up of this process, or None; starts nothing."""
+    return _current
+
+
+def main():
+    if sys.argv[1:2] == ["run"]:
+        # Warm in the background while the server starts and serves
+        from streamlit.web import cli
+
+        # Through the package, not ``__main__``: sessions import
+        # ``zappos_dash.warmup`` and must find this warm-up there
+        from zappos_dash import warmup
+
+        warmup.start()
+        cli.main(args=sys.argv[1:], prog_name="streamlit")
+        return
+
+    warm = WarmUp(selected_dashboards())
+    warm.run()
+    report = warm.report()
+    print(f"Warmed {report['datasets']} datasets and {report['figures']} figures of "
+          f"{report['pages_total']} pages in {report['seconds']:.2f} s"
+          + (f"; failed: {', '.join(report['failed'])}" if report['failed'] else ""))
+
+
+if __name__ == "__main__":
+    main()